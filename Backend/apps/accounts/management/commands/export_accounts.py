@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.exports import DATASETS, DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, RowCounter, iter_encoded, iter_rows
+
+
+class Command(BaseCommand):
+    help = "Exporta usuarios o el historial de PasswordResetRequest en CSV/JSONL sin cargar la tabla en memoria."
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=sorted(DATASETS), help="Tabla a exportar.")
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="Formato de salida (default: csv).")
+        parser.add_argument("--gzip", action="store_true", help="Comprime la salida con gzip (requiere --output).")
+        parser.add_argument("--output", help="Archivo de destino (por defecto, la salida estándar).")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Filas leídas por consulta (default: {DEFAULT_CHUNK_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        dataset = options["dataset"]
+        output = options["output"]
+        if options["gzip"] and not output:
+            raise CommandError("--gzip requiere --output")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size debe ser mayor a 0")
+
+        counter = RowCounter(iter_rows(dataset, options["chunk_size"]))
+        blocks = iter_encoded(dataset, options["format"], counter, gzip=options["gzip"])
+
+        started = time.perf_counter()
+        written = 0
+        if output:
+            with open(output, "wb") as handle:
+                for block in blocks:
+                    handle.write(block)
+                    written += len(block)
+        else:
+            for block in blocks:
+                self.stdout.write(block.decode("utf-8"), ending="")
+                written += len(block)
+
+        elapsed = time.perf_counter() - started
+        rate = counter.count / elapsed if elapsed > 0 else 0.0
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"Exportadas {counter.count} filas de {dataset} ({written} bytes) en {elapsed:.2f}s ({rate:.0f} filas/s)."
+            )
+        )
+
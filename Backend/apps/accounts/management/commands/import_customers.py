@@ -0,0 +1,265 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from apps.accounts.serializers import PASSWORD_POLICY_MESSAGE
+from apps.common.validators import normalize_email, validate_password_policy
+
+FORMATS = ("csv", "jsonl")
+MAX_NAME_LENGTH = 150
+
+
+def _init_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def _hash_password(raw: str) -> str:
+    return make_password(raw)
+
+
+def _detect_format(path: Path) -> str:
+    suffix = path.suffix.lower().lstrip(".")
+    if suffix == "json":
+        return "jsonl"
+    if suffix in FORMATS:
+        return suffix
+    raise CommandError(f"No se pudo detectar el formato de {path.name}; usá --format.")
+
+
+def _iter_records(handle, fmt: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """Yield (numero_de_fila, registro); registro es None si la fila no se pudo leer."""
+    if fmt == "csv":
+        for row_number, row in enumerate(csv.DictReader(handle), start=1):
+            yield row_number, row
+        return
+
+    row_number = 0
+    for line in handle:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield row_number, None
+            continue
+        yield row_number, record if isinstance(record, dict) else None
+
+
+def _clean_record(record: Optional[Dict[str, Any]], prehashed: bool) -> Tuple[Optional[Dict[str, str]], str]:
+    if record is None:
+        return None, "Fila con formato inválido"
+
+    nombre = str(record.get("nombre_completo") or "").strip()
+    if not nombre:
+        return None, "nombre_completo es obligatorio"
+    if len(nombre) > MAX_NAME_LENGTH:
+        return None, f"nombre_completo supera los {MAX_NAME_LENGTH} caracteres"
+
+    raw_email = record.get("email")
+    if not isinstance(raw_email, str):
+        return None, "Email inválido"
+    email = normalize_email(raw_email)
+    try:
+        validate_email(email)
+    except ValidationError:
+        return None, "Email inválido"
+    if len(email) > MAX_NAME_LENGTH:
+        return None, f"Email supera los {MAX_NAME_LENGTH} caracteres"
+
+    password = str(record.get("password") or "")
+    if prehashed:
+        try:
+            identify_hasher(password)
+        except ValueError:
+            return None, "Hash de contraseña no reconocido"
+    elif not validate_password_policy(password):
+        return None, PASSWORD_POLICY_MESSAGE
+
+    return {"nombre": nombre, "email": email, "password": password}, ""
+
+
+def _existing_emails(emails: List[str]) -> set:
+    User = get_user_model()
+    queryset = User.objects.annotate(email_lower=Lower("email"))
+    if hasattr(User, "username"):
+        rows = queryset.filter(Q(email_lower__in=emails) | Q(username__in=emails)).values_list("email_lower", "username")
+        return {value for row in rows for value in row}
+    return set(queryset.filter(email_lower__in=emails).values_list("email_lower", flat=True))
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa clientes desde un archivo CSV o JSONL (columnas nombre_completo, email, password) "
+        "en bloques, con hashing en paralelo y bulk_create."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo CSV o JSONL a importar.")
+        parser.add_argument("--format", choices=FORMATS, help="Formato del archivo (por defecto, según la extensión).")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Filas por bloque (default: 1000).")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Procesos para hashear contraseñas; 1 hashea en el proceso actual.",
+        )
+        parser.add_argument(
+            "--prehashed",
+            action="store_true",
+            help="La columna password ya contiene un hash de Django (p. ej. pbkdf2_sha256$...).",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Archivo de progreso; si existe, la importación continúa desde la última fila confirmada.",
+        )
+        parser.add_argument("--rejects", help="Archivo CSV donde escribir las filas rechazadas y el motivo.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"No existe el archivo {path}")
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size debe ser mayor a 0")
+
+        fmt = options["format"] or _detect_format(path)
+        prehashed = options["prehashed"]
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+        start_after = self._load_checkpoint(checkpoint, path)
+
+        self.imported = 0
+        self.rejected = 0
+        processed = 0
+        started = time.perf_counter()
+
+        self.workers = options["workers"]
+        pool = None
+        if not prehashed and self.workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+        rejects_handle = None
+        self.rejects_writer = None
+        if options["rejects"]:
+            # Al retomar se agregan las filas rechazadas a las de la corrida anterior.
+            rejects_handle = open(options["rejects"], "a" if start_after else "w", newline="", encoding="utf-8")
+            self.rejects_writer = csv.writer(rejects_handle)
+            if not start_after:
+                self.rejects_writer.writerow(["fila", "email", "motivo"])
+
+        try:
+            with path.open(newline="", encoding="utf-8-sig") as handle:
+                records = (item for item in _iter_records(handle, fmt) if item[0] > start_after)
+                while True:
+                    chunk = list(islice(records, chunk_size))
+                    if not chunk:
+                        break
+                    self._import_chunk(chunk, prehashed, pool)
+                    processed += len(chunk)
+                    last_row = chunk[-1][0]
+                    self._save_checkpoint(checkpoint, path, last_row)
+                    if options["verbosity"] >= 2:
+                        elapsed = time.perf_counter() - started
+                        self.stdout.write(
+                            f"Fila {last_row}: {self.imported} importadas, {self.rejected} rechazadas "
+                            f"({processed / elapsed:.0f} filas/s)"
+                        )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if rejects_handle is not None:
+                rejects_handle.close()
+
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Importación finalizada: {self.imported} importadas, {self.rejected} rechazadas, "
+                f"{processed} filas en {elapsed:.2f}s ({rate:.0f} filas/s)."
+            )
+        )
+
+    def _import_chunk(self, chunk, prehashed: bool, pool: Optional[ProcessPoolExecutor]) -> None:
+        candidates: Dict[str, Tuple[int, Dict[str, str]]] = {}
+        for row_number, record in chunk:
+            cleaned, reason = _clean_record(record, prehashed)
+            if cleaned is None:
+                self._reject(row_number, record, reason)
+            elif cleaned["email"] in candidates:
+                self._reject(row_number, record, "Email duplicado en el archivo")
+            else:
+                candidates[cleaned["email"]] = (row_number, cleaned)
+
+        if candidates:
+            existing = _existing_emails(list(candidates))
+            for email in [email for email in candidates if email in existing]:
+                row_number, cleaned = candidates.pop(email)
+                self._reject(row_number, cleaned, "Ya existe una cuenta con ese email")
+
+        if not candidates:
+            return
+
+        rows = [cleaned for _, cleaned in candidates.values()]
+        passwords = [row["password"] for row in rows]
+        if prehashed:
+            hashes: Iterable[str] = passwords
+        elif pool is not None:
+            hashes = pool.map(_hash_password, passwords, chunksize=max(1, len(passwords) // (self.workers * 4)))
+        else:
+            hashes = map(_hash_password, passwords)
+
+        User = get_user_model()
+        users = []
+        for row, password_hash in zip(rows, hashes):
+            user = User(email=row["email"], is_active=True, password=password_hash)
+            if hasattr(User, "username"):
+                user.username = row["email"]
+            if hasattr(User, "first_name"):
+                user.first_name = row["nombre"]
+            users.append(user)
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=len(users))
+        self.imported += len(users)
+
+    def _reject(self, row_number: int, record: Optional[Dict[str, Any]], reason: str) -> None:
+        self.rejected += 1
+        if self.rejects_writer:
+            email = str((record or {}).get("email") or "")
+            self.rejects_writer.writerow([row_number, email, reason])
+
+    def _load_checkpoint(self, checkpoint: Optional[Path], source: Path) -> int:
+        if checkpoint is None or not checkpoint.exists():
+            return 0
+        try:
+            state = json.loads(checkpoint.read_text(encoding="utf-8"))
+        except ValueError as exc:
+            raise CommandError(f"Checkpoint ilegible: {checkpoint}") from exc
+        if state.get("source") != str(source.resolve()):
+            raise CommandError(f"El checkpoint {checkpoint} corresponde a otro archivo ({state.get('source')}).")
+        last_row = int(state.get("last_row", 0))
+        self.stdout.write(f"Retomando la importación después de la fila {last_row}.")
+        return last_row
+
+    def _save_checkpoint(self, checkpoint: Optional[Path], source: Path, last_row: int) -> None:
+        if checkpoint is None:
+            return
+        tmp = checkpoint.with_name(checkpoint.name + ".tmp")
+        tmp.write_text(json.dumps({"source": str(source.resolve()), "last_row": last_row}), encoding="utf-8")
+        os.replace(tmp, checkpoint)
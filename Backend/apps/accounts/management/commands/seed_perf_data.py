@@ -0,0 +1,239 @@
+import math
+import random
+import time
+from datetime import timedelta
+from typing import List, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.accounts.models import PasswordResetRequest
+
+# Marca de los usuarios generados, para poder purgarlos sin tocar datos reales.
+SEED_MARKER = "perf-seed"
+SEED_PASSWORD = "Clave#2025"
+
+EMAIL_DOMAINS = (
+    ("gmail.com", 48),
+    ("hotmail.com", 18),
+    ("outlook.com", 10),
+    ("yahoo.com.ar", 8),
+    ("live.com", 4),
+    ("icloud.com", 4),
+    ("fibertel.com.ar", 4),
+    ("panaderia.com.ar", 4),
+)
+DOMAIN_NAMES = [domain for domain, _ in EMAIL_DOMAINS]
+DOMAIN_WEIGHTS = [weight for _, weight in EMAIL_DOMAINS]
+FIRST_NAMES = (
+    "ana", "beatriz", "carla", "diego", "esteban", "florencia", "gonzalo", "hernan", "ines", "julian",
+    "lucia", "martin", "natalia", "pablo", "romina", "santiago", "sofia", "tomas", "valentina", "zoe",
+)
+LAST_NAMES = (
+    "gomez", "rodriguez", "fernandez", "lopez", "martinez", "garcia", "perez", "sanchez", "romero", "diaz",
+    "alvarez", "torres", "ruiz", "ramirez", "flores", "benitez", "acosta", "medina", "herrera", "suarez",
+)
+RESET_LIFETIME = timedelta(minutes=15)
+# Campos del modelo de usuario de django.contrib.auth que usa el generador (last_name guarda la marca).
+REQUIRED_USER_FIELDS = ("username", "first_name", "last_name")
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera usuarios y solicitudes de restablecimiento sintéticos, con distribuciones realistas y "
+        "semilla determinística, para benchmarks y EXPLAIN sobre volúmenes de producción."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100_000, help="Usuarios a generar (default: 100000).")
+        parser.add_argument(
+            "--resets-per-user",
+            type=float,
+            default=1.5,
+            help="Promedio de PasswordResetRequest por usuario (default: 1.5).",
+        )
+        parser.add_argument("--expired-ratio", type=float, default=0.6, help="Fracción de solicitudes vencidas (default: 0.6).")
+        parser.add_argument("--used-ratio", type=float, default=0.35, help="Fracción de solicitudes usadas (default: 0.35).")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Filas por bulk_create (default: 5000).")
+        parser.add_argument("--seed", type=int, default=42, help="Semilla del generador (default: 42).")
+        parser.add_argument("--purge", action="store_true", help="Borra los datos sintéticos existentes antes de generar.")
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Al terminar, muestra el plan de las consultas de login y restablecimiento.",
+        )
+
+    def handle(self, *args, **options):
+        expired_ratio = options["expired_ratio"]
+        used_ratio = options["used_ratio"]
+        if min(expired_ratio, used_ratio) < 0 or expired_ratio + used_ratio > 1:
+            raise CommandError("--expired-ratio y --used-ratio deben ser >= 0 y sumar como máximo 1")
+        if options["batch_size"] < 1 or options["users"] < 0 or options["resets_per_user"] < 0:
+            raise CommandError("--users, --resets-per-user y --batch-size no pueden ser negativos")
+        missing = [field for field in REQUIRED_USER_FIELDS if not hasattr(get_user_model(), field)]
+        if missing:
+            raise CommandError(f"El modelo de usuario no tiene los campos requeridos: {', '.join(missing)}")
+
+        if options["purge"]:
+            self._purge(options["batch_size"])
+        elif get_user_model().objects.filter(last_name=SEED_MARKER).exists():
+            raise CommandError("Ya hay datos sintéticos cargados; usá --purge para regenerarlos.")
+
+        self.rng = random.Random(options["seed"])
+        self.now = timezone.now()
+        self.seed = options["seed"]
+        self.password_hash = make_password(SEED_PASSWORD)
+        self.reset_sequence = 0
+        self.status_weights = (used_ratio, expired_ratio, 1 - used_ratio - expired_ratio)
+        self.stale_weights = (used_ratio, expired_ratio) if used_ratio + expired_ratio > 0 else (1, 1)
+        self.resets_per_user = options["resets_per_user"]
+
+        started = time.perf_counter()
+        total_users = options["users"]
+        batch_size = options["batch_size"]
+        created_users = 0
+        created_resets = 0
+        for offset in range(0, total_users, batch_size):
+            count = min(batch_size, total_users - offset)
+            with transaction.atomic():
+                user_ids = self._create_users(offset, count)
+                created_resets += self._create_resets(user_ids, batch_size)
+            created_users += count
+            if options["verbosity"] >= 2:
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{created_users}/{total_users} usuarios, {created_resets} solicitudes "
+                    f"({(created_users + created_resets) / elapsed:.0f} filas/s)"
+                )
+
+        elapsed = time.perf_counter() - started
+        rate = (created_users + created_resets) / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generados {created_users} usuarios y {created_resets} solicitudes de restablecimiento "
+                f"en {elapsed:.2f}s ({rate:.0f} filas/s). Contraseña de los usuarios: {SEED_PASSWORD}"
+            )
+        )
+        if options["explain"]:
+            self._explain()
+
+    def _purge(self, batch_size: int) -> None:
+        User = get_user_model()
+        seeded = User.objects.filter(last_name=SEED_MARKER).order_by("pk").values_list("pk", flat=True)
+        deleted = 0
+        while True:
+            ids = list(seeded[:batch_size])
+            if not ids:
+                break
+            with transaction.atomic():
+                PasswordResetRequest.objects.filter(user_id__in=ids).delete()
+                User.objects.filter(pk__in=ids).delete()
+            deleted += len(ids)
+        self.stdout.write(f"Eliminados {deleted} usuarios sintéticos.")
+
+    def _identity_for(self, index: int) -> Tuple[str, str]:
+        rng = self.rng
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        domain = rng.choices(DOMAIN_NAMES, weights=DOMAIN_WEIGHTS)[0]
+        local = f"{first}.{last}{index}"
+        # Una parte de las cuentas históricas se registró con mayúsculas (ejercita email__iexact).
+        if rng.random() < 0.1:
+            local = local.capitalize()
+        return f"{local}@{domain}", f"{first.capitalize()} {last.capitalize()}"
+
+    def _create_users(self, offset: int, count: int) -> List[int]:
+        User = get_user_model()
+        users = []
+        for index in range(offset, offset + count):
+            email, nombre = self._identity_for(index)
+            date_joined = self.now - timedelta(days=self.rng.uniform(0, 3 * 365))
+            user = User(
+                username=email.lower(),
+                email=email,
+                first_name=nombre,
+                last_name=SEED_MARKER,
+                password=self.password_hash,
+                is_active=self.rng.random() < 0.97,
+                date_joined=date_joined,
+            )
+            if self.rng.random() < 0.8:
+                user.last_login = date_joined + (self.now - date_joined) * self.rng.random()
+            users.append(user)
+
+        User.objects.bulk_create(users, batch_size=count)
+        if all(user.pk is not None for user in users):
+            return [user.pk for user in users]
+        # Backends sin RETURNING (MySQL) no completan la pk tras bulk_create.
+        usernames = [user.username for user in users]
+        by_username = dict(User.objects.filter(username__in=usernames).values_list("username", "pk"))
+        return [by_username[username] for username in usernames]
+
+    def _create_resets(self, user_ids: List[int], batch_size: int) -> int:
+        rng = self.rng
+        resets = []
+        for user_id in user_ids:
+            live_assigned = False
+            for _ in range(self._reset_count()):
+                status = rng.choices(("used", "expired", "live"), weights=self.status_weights)[0]
+                # create_for_user invalida las solicitudes previas: como mucho una vigente por usuario.
+                # Una vigente extra se vuelve a sortear entre usada/vencida según sus pesos.
+                if status == "live" and live_assigned:
+                    status = rng.choices(("used", "expired"), weights=self.stale_weights)[0]
+                resets.append(self._build_reset(user_id, status))
+                live_assigned = live_assigned or status == "live"
+
+        PasswordResetRequest.objects.bulk_create(resets, batch_size=batch_size)
+        # created_at es auto_now_add y bulk_create lo pisa con "ahora"; toda solicitud vence
+        # RESET_LIFETIME después de creada, así que se reconstruye con un UPDATE por bloque.
+        PasswordResetRequest.objects.filter(user_id__in=user_ids).update(created_at=F("expires_at") - RESET_LIFETIME)
+        return len(resets)
+
+    def _reset_count(self) -> int:
+        """Draw a geometric count whose mean is ``--resets-per-user`` (p = 1 / (1 + mean))."""
+        mean = self.resets_per_user
+        if not mean:
+            return 0
+        return int(math.log(1.0 - self.rng.random()) / math.log(mean / (1 + mean)))
+
+    def _build_reset(self, user_id: int, status: str) -> PasswordResetRequest:
+        rng = self.rng
+        self.reset_sequence += 1
+        if status == "live":
+            created_at = self.now - timedelta(seconds=rng.uniform(0, RESET_LIFETIME.total_seconds() - 60))
+        else:
+            created_at = self.now - timedelta(days=rng.uniform(0, 180), minutes=RESET_LIFETIME.total_seconds() / 60)
+        used_at = None
+        if status == "used":
+            used_at = created_at + timedelta(seconds=rng.uniform(30, RESET_LIFETIME.total_seconds()))
+        return PasswordResetRequest(
+            user_id=user_id,
+            token_hash=PasswordResetRequest._hash_token(f"perf-{self.seed}-{self.reset_sequence}"),
+            expires_at=created_at + RESET_LIFETIME,
+            used_at=used_at,
+            ip=f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}",
+            user_agent=rng.choice(("Mozilla/5.0 (Android)", "Mozilla/5.0 (iPhone)", "Mozilla/5.0 (Windows NT 10.0)")),
+        )
+
+    def _explain(self) -> None:
+        User = get_user_model()
+        sample = User.objects.filter(last_name=SEED_MARKER).order_by("pk").values_list("pk", "email").first()
+        if sample is None:
+            return
+        user_id, email = sample
+        queries = {
+            "LoginSerializer / ForgotPasswordView: email__iexact": User.objects.filter(email__iexact=email.upper()),
+            "find_valid_by_token: token_hash": PasswordResetRequest.objects.filter(
+                token_hash=PasswordResetRequest._hash_token(f"perf-{self.seed}-1")
+            ),
+            "create_for_user: solicitudes vigentes": PasswordResetRequest.objects.filter(
+                user_id=user_id, used_at__isnull=True, expires_at__gt=timezone.now()
+            ),
+        }
+        for label, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(queryset.explain())
@@ -0,0 +1,73 @@
+import csv
+import gzip
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.accounts.models import PasswordResetRequest
+
+
+pytestmark = pytest.mark.django_db
+
+URL = "/api/v1/accounts/export/"
+
+
+@pytest.fixture
+def users():
+    User = get_user_model()
+    created = [
+        User.objects.create_user(username=f"user{i}@x.com", email=f"user{i}@x.com", password="Clave#2025")
+        for i in range(5)
+    ]
+    PasswordResetRequest.create_for_user(created[0], ip="10.0.0.1", user_agent="pytest")
+    return created
+
+
+def test_command_exports_users_csv_in_chunks(users, tmp_path):
+    target = tmp_path / "users.csv"
+    err = StringIO()
+    call_command("export_accounts", "users", "--output", str(target), "--chunk-size", "2", stderr=err)
+
+    with target.open(encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["email"] for row in rows] == [u.email for u in users]
+    assert "password" not in rows[0]
+    assert "Exportadas 5 filas de users" in err.getvalue()
+
+
+def test_command_exports_password_resets_jsonl_gzip(users, tmp_path):
+    target = tmp_path / "resets.jsonl.gz"
+    call_command("export_accounts", "password-resets", "--format", "jsonl", "--gzip", "--output", str(target), stderr=StringIO())
+
+    lines = gzip.decompress(target.read_bytes()).decode("utf-8").splitlines()
+    record = json.loads(lines[0])
+    assert record["user__email"] == "user0@x.com"
+    assert record["ip"] == "10.0.0.1"
+    assert "token_hash" not in record
+
+
+def test_endpoint_requires_admin(users):
+    client = APIClient()
+    assert client.get(URL).status_code == 401
+    client.force_authenticate(users[0])
+    assert client.get(URL).status_code == 403
+
+
+def test_endpoint_streams_export_for_admin(users):
+    admin = get_user_model().objects.create_superuser(username="admin@x.com", email="admin@x.com", password="Clave#2025")
+    client = APIClient()
+    client.force_authenticate(admin)
+
+    resp = client.get(URL, {"dataset": "users", "output": "jsonl", "gzip": "1"})
+
+    assert resp.status_code == 200
+    assert resp.streaming is True
+    assert resp["Content-Type"] == "application/gzip"
+    body = gzip.decompress(b"".join(resp.streaming_content)).decode("utf-8")
+    assert len(body.splitlines()) == 6
+
+    assert client.get(URL, {"dataset": "pedidos"}).status_code == 400
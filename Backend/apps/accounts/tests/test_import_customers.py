@@ -0,0 +1,89 @@
+import csv
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _write_csv(path, rows):
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["nombre_completo", "email", "password"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _run(*args):
+    out = StringIO()
+    call_command("import_customers", *args, "--workers", "1", stdout=out)
+    return out.getvalue()
+
+
+def test_import_csv_creates_users_and_rejects_invalid(tmp_path):
+    User = get_user_model()
+    User.objects.create_user(username="existe@x.com", email="Existe@x.com", password="Clave#2025")
+    source = tmp_path / "clientes.csv"
+    rejects = tmp_path / "rechazos.csv"
+    _write_csv(source, [
+        {"nombre_completo": "Ana Pérez", "email": " Ana@Example.com ", "password": "Clave#2025"},
+        {"nombre_completo": "Ana Bis", "email": "ana@example.com", "password": "Clave#2025"},
+        {"nombre_completo": "Ya Existe", "email": "existe@x.com", "password": "Clave#2025"},
+        {"nombre_completo": "Sin Politica", "email": "debil@example.com", "password": "soloLetras"},
+        {"nombre_completo": "", "email": "sinnombre@example.com", "password": "Clave#2025"},
+        {"nombre_completo": "Beto", "email": "beto@example.com", "password": "Clave#2026"},
+    ])
+
+    output = _run(str(source), "--chunk-size", "4", "--rejects", str(rejects))
+
+    assert "2 importadas, 4 rechazadas" in output
+    ana = User.objects.get(email="ana@example.com")
+    assert ana.username == "ana@example.com"
+    assert ana.first_name == "Ana Pérez"
+    assert ana.check_password("Clave#2025") is True
+    with rejects.open(encoding="utf-8") as handle:
+        reasons = {row["fila"]: row["motivo"] for row in csv.DictReader(handle)}
+    assert sorted(reasons) == ["2", "3", "4", "5"]
+    assert reasons["2"] == "Email duplicado en el archivo"
+    assert reasons["3"] == "Ya existe una cuenta con ese email"
+
+
+def test_import_jsonl_prehashed(tmp_path):
+    source = tmp_path / "clientes.jsonl"
+    lines = [
+        json.dumps({"nombre_completo": "Carla", "email": "carla@example.com", "password": make_password("Clave#2025")}),
+        json.dumps({"nombre_completo": "Dario", "email": "dario@example.com", "password": "texto-plano"}),
+        "{no es json",
+        json.dumps({"nombre_completo": "Eva", "email": 12345, "password": make_password("Clave#2025")}),
+    ]
+    source.write_text("\n".join(lines), encoding="utf-8")
+
+    rejects = tmp_path / "rechazos.csv"
+    output = _run(str(source), "--prehashed", "--rejects", str(rejects))
+
+    assert "1 importadas, 3 rechazadas" in output
+    with rejects.open(encoding="utf-8") as handle:
+        reasons = {row["fila"]: row["motivo"] for row in csv.DictReader(handle)}
+    assert reasons["4"] == "Email inválido"
+    assert get_user_model().objects.get(email="carla@example.com").check_password("Clave#2025") is True
+
+
+def test_import_resumes_from_checkpoint(tmp_path):
+    source = tmp_path / "clientes.csv"
+    _write_csv(source, [
+        {"nombre_completo": f"Cliente {i}", "email": f"cliente{i}@example.com", "password": "Clave#2025"}
+        for i in range(5)
+    ])
+    checkpoint = tmp_path / "progreso.json"
+    checkpoint.write_text(json.dumps({"source": str(source.resolve()), "last_row": 3}), encoding="utf-8")
+
+    output = _run(str(source), "--checkpoint", str(checkpoint), "--chunk-size", "2")
+
+    assert "Retomando la importación después de la fila 3" in output
+    emails = set(get_user_model().objects.values_list("email", flat=True))
+    assert emails == {"cliente3@example.com", "cliente4@example.com"}
+    assert json.loads(checkpoint.read_text(encoding="utf-8"))["last_row"] == 5
@@ -0,0 +1,60 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from apps.accounts.models import PasswordResetRequest
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _seed(*args):
+    out = StringIO()
+    call_command("seed_perf_data", "--users", "200", "--batch-size", "64", *args, stdout=out)
+    return out.getvalue()
+
+
+def test_seed_generates_users_and_reset_distribution():
+    _seed("--seed", "7", "--resets-per-user", "3")
+
+    User = get_user_model()
+    assert User.objects.filter(last_name="perf-seed").count() == 200
+    user = User.objects.filter(last_name="perf-seed").first()
+    assert user.check_password("Clave#2025") is True
+
+    now = timezone.now()
+    resets = PasswordResetRequest.objects.all()
+    total = resets.count()
+    used = resets.filter(used_at__isnull=False).count()
+    expired = resets.filter(used_at__isnull=True, expires_at__lte=now).count()
+    live = resets.filter(used_at__isnull=True, expires_at__gt=now).count()
+    # Media geométrica 3 por usuario: 600 esperadas, desvío ~50.
+    assert 450 < total < 750
+    assert used + expired + live == total
+    assert used > 0 and expired > 0 and live > 0
+    assert all(r.created_at < now for r in resets.filter(used_at__isnull=False)[:20])
+    assert all(r.expires_at - r.created_at == timedelta(minutes=15) for r in resets)
+    assert PasswordResetRequest._meta.get_field("created_at").auto_now_add is True
+
+
+def test_seed_is_deterministic_and_requires_purge():
+    _seed("--seed", "3")
+    first = list(get_user_model().objects.order_by("pk").values_list("email", flat=True))
+
+    with pytest.raises(CommandError):
+        _seed("--seed", "3")
+
+    _seed("--seed", "3", "--purge")
+    second = list(get_user_model().objects.order_by("pk").values_list("email", flat=True))
+    assert first == second
+
+
+def test_seed_explain_prints_query_plans():
+    output = _seed("--explain")
+    assert "email__iexact" in output
+    assert "token_hash" in output
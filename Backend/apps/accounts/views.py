@@ -1,19 +1,23 @@
 ﻿import logging
+import time
 from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.common.circuit import get_breaker
 from apps.common.request import get_client_ip
+from apps.common.throttling import ClientIPAnonRateThrottle
 
+from .exports import DATASETS, EXPORT_FORMATS, RowCounter, iter_encoded, iter_rows
 from .models import PasswordResetRequest
 from .serializers import (
     ForgotPasswordSerializer,
@@ -54,6 +58,25 @@ def _get_reset_request_for_logging(token: Optional[str]) -> Optional[PasswordRes
     return PasswordResetRequest.objects.select_related('user').filter(token_hash=token_hash).first()
 
 
+def _stream_export(dataset: str, fmt: str, gzip: bool, client_ip: str):
+    counter = RowCounter(iter_rows(dataset))
+    started = time.perf_counter()
+    try:
+        yield from iter_encoded(dataset, fmt, counter, gzip=gzip)
+    finally:
+        elapsed = time.perf_counter() - started
+        logger.info(
+            'accounts_export',
+            extra={
+                'dataset': dataset,
+                'rows': counter.count,
+                'seconds': round(elapsed, 3),
+                'rows_per_second': round(counter.count / elapsed) if elapsed > 0 else 0,
+                'ip': client_ip,
+            },
+        )
+
+
 class RegisterView(generics.CreateAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = RegisterSerializer
@@ -71,7 +94,7 @@ class RegisterView(generics.CreateAPIView):
 
 class LoginView(APIView):
     permission_classes = [permissions.AllowAny]
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [ClientIPAnonRateThrottle]
 
     def post(self, request, *args, **kwargs):
         serializer = LoginSerializer(data=request.data, context={'request': request})
@@ -106,11 +129,13 @@ class LoginView(APIView):
 
 class ForgotPasswordView(APIView):
     permission_classes = [permissions.AllowAny]
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [ClientIPAnonRateThrottle]
 
     def post(self, request, *args, **kwargs):
         serializer = ForgotPasswordSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        # Con el SMTP caído todos reciben el mismo 503, exista o no la cuenta, y sin tocar sus tokens.
+        get_breaker('smtp').check()
         email = serializer.validated_data['email']
         client_ip = get_client_ip(request)
         user_agent = (request.META.get('HTTP_USER_AGENT') or '')[:255]
@@ -131,7 +156,7 @@ class ForgotPasswordView(APIView):
 
 class ResetPasswordValidateView(APIView):
     permission_classes = [permissions.AllowAny]
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [ClientIPAnonRateThrottle]
 
     def get(self, request, *args, **kwargs):
         serializer = ResetPasswordValidateSerializer(data={'token': request.query_params.get('token')})
@@ -152,7 +177,7 @@ class ResetPasswordValidateView(APIView):
 
 class ResetPasswordView(APIView):
     permission_classes = [permissions.AllowAny]
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [ClientIPAnonRateThrottle]
 
     def post(self, request, *args, **kwargs):
         serializer = ResetPasswordSerializer(data=request.data)
@@ -182,3 +207,29 @@ class ResetPasswordView(APIView):
             extra={'email': user.email, 'ts': timezone.now().isoformat(), 'ip': client_ip},
         )
         return Response({"message": "Contraseña actualizada"}, status=status.HTTP_200_OK)
+
+
+class AccountsExportView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+    batchable = False
+
+    def get(self, request, *args, **kwargs):
+        dataset = request.query_params.get('dataset', 'users')
+        fmt = request.query_params.get('output', 'csv')
+        gzip = request.query_params.get('gzip') in ('1', 'true')
+        if dataset not in DATASETS:
+            return Response({'detail': f"dataset debe ser uno de: {', '.join(sorted(DATASETS))}"}, status=status.HTTP_400_BAD_REQUEST)
+        if fmt not in EXPORT_FORMATS:
+            return Response({'detail': f"output debe ser uno de: {', '.join(EXPORT_FORMATS)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        filename = f"{dataset}-{timezone.now():%Y%m%d%H%M%S}.{fmt}"
+        content_type = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+        if gzip:
+            filename += '.gz'
+            content_type = 'application/gzip'
+        response = StreamingHttpResponse(
+            _stream_export(dataset, fmt, gzip, get_client_ip(request)),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,7 @@
+from django.db.backends.sqlite3 import base
+
+from apps.common.circuit import CircuitBreakerDatabaseMixin
+
+
+class DatabaseWrapper(CircuitBreakerDatabaseMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,208 @@
+"""Circuit breakers for outbound dependencies (SMTP server, database host)."""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuito '{name}' abierto; reintentar en {retry_after:.0f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Classic closed / open / half-open breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and every call fails
+    fast with :class:`CircuitOpenError`. Once ``reset_timeout`` seconds have passed a single
+    probe call is let through: success closes the breaker, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        listener: Optional[Callable[["CircuitBreaker", str], None]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        # Se llama fuera del lock con (breaker, estado) cada vez que el breaker abre o cierra.
+        self._listener = listener
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = 0.0
+            self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def snapshot(self) -> Dict:
+        state = self.state
+        retry_after = 0.0
+        if state == OPEN:
+            retry_after = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+        return {"state": state, "failures": self._failures, "retry_after": round(retry_after, 1)}
+
+    def check(self) -> None:
+        """Raise :class:`CircuitOpenError` if a call made now would be rejected, without calling."""
+        with self._lock:
+            if self._state == OPEN:
+                remaining = self.reset_timeout - (self._clock() - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, remaining)
+            elif self._state == HALF_OPEN and self._probing:
+                raise CircuitOpenError(self.name, self.reset_timeout)
+
+    def call(self, func: Callable, *args, **kwargs):
+        self._acquire()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._on_failure()
+            raise
+        except BaseException:
+            # KeyboardInterrupt, SystemExit...: no dicen nada de la dependencia, pero liberan la prueba.
+            self._release_probe()
+            raise
+        self._on_success()
+        return result
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._state == OPEN:
+                remaining = self.reset_timeout - (self._clock() - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, remaining)
+                self._state = HALF_OPEN
+                self._probing = False
+            if self._state == HALF_OPEN:
+                if self._probing:
+                    raise CircuitOpenError(self.name, self.reset_timeout)
+                self._probing = True
+
+    def _on_success(self) -> None:
+        with self._lock:
+            changed = self._state != CLOSED
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+        if changed:
+            self._notify(CLOSED)
+
+    def _release_probe(self) -> None:
+        with self._lock:
+            self._probing = False
+
+    def _on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            opened = self._state == HALF_OPEN or self._failures >= self.failure_threshold
+            if opened:
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+        if opened:
+            self._notify(OPEN)
+
+    def _notify(self, state: str) -> None:
+        if self._listener is None:
+            return
+        try:
+            self._listener(self, state)
+        except Exception:
+            logger.warning("circuit_breaker_listener_failed", extra={"breaker": self.name}, exc_info=True)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker ``name``, configured from settings on first use."""
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=int(getattr(settings, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)),
+                reset_timeout=float(getattr(settings, "CIRCUIT_BREAKER_RESET_TIMEOUT", 30)),
+                listener=publish_state,
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+def breaker_states() -> Dict[str, Dict]:
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+def _shared_cache():
+    return caches[getattr(settings, "CIRCUIT_BREAKER_CACHE", "default")]
+
+
+def _shared_key(name: str) -> str:
+    return f"circuit-breaker:{name}"
+
+
+def publish_state(breaker: CircuitBreaker, state: str) -> None:
+    """Record ``breaker``'s last transition in ``CIRCUIT_BREAKER_CACHE`` for other processes.
+
+    Breakers live in each worker's memory; with a shared cache backend (Redis, Memcached,
+    database) this is how ``check_db`` sees what the web workers see.
+    """
+    _shared_cache().set(
+        _shared_key(breaker.name),
+        {"state": state, "pid": os.getpid(), "changed_at": time.time(), "reset_timeout": breaker.reset_timeout},
+        timeout=None,
+    )
+
+
+def shared_state(name: str) -> Optional[Dict]:
+    """Return the last transition published for ``name`` by any process, or ``None``.
+
+    An ``open`` entry older than its reset timeout is reported as ``half_open``.
+    """
+    entry = _shared_cache().get(_shared_key(name))
+    if entry is None:
+        return None
+    entry = dict(entry, age=round(time.time() - entry["changed_at"], 1))
+    if entry["state"] == OPEN and entry["age"] >= entry["reset_timeout"]:
+        entry["state"] = HALF_OPEN
+    return entry
+
+
+class CircuitBreakerDatabaseMixin:
+    """DatabaseWrapper mixin that opens new connections through the ``db:<alias>`` breaker."""
+
+    def get_new_connection(self, conn_params):
+        return get_breaker(f"db:{self.alias}").call(super().get_new_connection, conn_params)
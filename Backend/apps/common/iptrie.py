@@ -0,0 +1,75 @@
+"""Binary prefix trie (radix index) for longest-prefix CIDR lookups."""
+
+import ipaddress
+from typing import Any, Iterable, Optional
+
+_EMPTY = object()
+# Nodo: [hijo bit 0, hijo bit 1, valor]
+_VALUE = 2
+
+
+def parse_ip(value: str):
+    """Return an ``ip_address`` (IPv4-mapped IPv6 unwrapped to IPv4) or ``None`` if invalid."""
+    try:
+        address = ipaddress.ip_address(value.strip())
+    except ValueError:
+        return None
+    if address.version == 6 and address.ipv4_mapped is not None:
+        return address.ipv4_mapped
+    return address
+
+
+class IPPrefixTrie:
+    """Map CIDR blocks to values; :meth:`lookup` returns the value of the longest matching prefix.
+
+    Lookups walk at most one node per address bit (32 for IPv4, 128 for IPv6), independent
+    of how many networks are indexed.
+    """
+
+    def __init__(self):
+        self._roots = {4: [None, None, _EMPTY], 6: [None, None, _EMPTY]}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, cidr: str, value: Any = True) -> None:
+        network = ipaddress.ip_network(cidr.strip(), strict=False)
+        bits = int(network.network_address)
+        width = network.max_prefixlen
+        node = self._roots[network.version]
+        for depth in range(network.prefixlen):
+            bit = (bits >> (width - 1 - depth)) & 1
+            child = node[bit]
+            if child is None:
+                child = node[bit] = [None, None, _EMPTY]
+            node = child
+        if node[_VALUE] is _EMPTY:
+            self._size += 1
+        node[_VALUE] = value
+
+    def lookup(self, ip: str, default: Optional[Any] = None) -> Any:
+        address = parse_ip(ip)
+        if address is None:
+            return default
+        bits = int(address)
+        width = address.max_prefixlen
+        node = self._roots[address.version]
+        found = node[_VALUE]
+        for depth in range(width):
+            node = node[(bits >> (width - 1 - depth)) & 1]
+            if node is None:
+                break
+            if node[_VALUE] is not _EMPTY:
+                found = node[_VALUE]
+        return default if found is _EMPTY else found
+
+    def __contains__(self, ip: str) -> bool:
+        return self.lookup(ip, _EMPTY) is not _EMPTY
+
+    @classmethod
+    def from_cidrs(cls, cidrs: Iterable[str], value: Any = True) -> "IPPrefixTrie":
+        trie = cls()
+        for cidr in cidrs:
+            trie.insert(cidr, value)
+        return trie
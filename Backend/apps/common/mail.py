@@ -0,0 +1,29 @@
+"""Email backend guarded by a circuit breaker."""
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+
+from .circuit import get_breaker
+
+
+class CircuitBreakerEmailBackend(BaseEmailBackend):
+    """Delegate to ``CIRCUIT_BREAKER_EMAIL_BACKEND`` through the ``smtp`` breaker."""
+
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently)
+        self.backend = get_connection(settings.CIRCUIT_BREAKER_EMAIL_BACKEND, fail_silently=fail_silently, **kwargs)
+
+    @property
+    def breaker(self):
+        # No se guarda en la instancia: el backend locmem hace deepcopy de los mensajes.
+        return get_breaker("smtp")
+
+    def open(self):
+        return self.breaker.call(self.backend.open)
+
+    def close(self):
+        return self.backend.close()
+
+    def send_messages(self, email_messages):
+        return self.breaker.call(self.backend.send_messages, email_messages)
@@ -0,0 +1,147 @@
+"""Project-wide middleware."""
+
+import hmac
+import random
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.db import connection
+from django.http import JsonResponse
+
+from .circuit import CircuitOpenError
+from .iptrie import IPPrefixTrie
+from .profiling import ProfileDumper, ProfileStore, StackSampler
+from .querylog import SlowQueryLogger
+from .request import get_client_ip
+
+ALLOW = "allow"
+DENY = "deny"
+
+
+def _read_cidr_file(path: str):
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            entry = line.split("#", 1)[0].strip()
+            if entry:
+                yield entry
+
+
+class IPFilterMiddleware:
+    """Drop requests from denied networks before any view, serializer or query runs.
+
+    ``IP_DENYLIST``, ``IP_DENYLIST_FILE`` (known abusive ranges, one CIDR per line) and
+    ``IP_ALLOWLIST`` are compiled once into an :class:`IPPrefixTrie`; the most specific
+    matching network decides, so an allowlisted host can sit inside a denied range.
+    Unmatched addresses get ``IP_FILTER_DEFAULT``.
+    """
+
+    def __init__(self, get_response):
+        denylist = list(getattr(settings, "IP_DENYLIST", ()))
+        denylist_file = getattr(settings, "IP_DENYLIST_FILE", None)
+        if denylist_file:
+            denylist.extend(_read_cidr_file(denylist_file))
+        allowlist = list(getattr(settings, "IP_ALLOWLIST", ()))
+        self.default = getattr(settings, "IP_FILTER_DEFAULT", ALLOW)
+        if self.default not in (ALLOW, DENY):
+            raise ImproperlyConfigured("IP_FILTER_DEFAULT debe ser 'allow' o 'deny'")
+        if not denylist and self.default == ALLOW:
+            raise MiddlewareNotUsed
+
+        self.index = IPPrefixTrie()
+        try:
+            for cidr in denylist:
+                self.index.insert(cidr, DENY)
+            for cidr in allowlist:
+                self.index.insert(cidr, ALLOW)
+        except ValueError as exc:
+            raise ImproperlyConfigured(f"CIDR inválido en la lista de IPs: {exc}") from exc
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.client_ip = get_client_ip(request)
+        if self.index.lookup(request.client_ip, self.default) == DENY:
+            return JsonResponse({"detail": "Acceso denegado"}, status=403)
+        return self.get_response(request)
+
+
+class SlowQueryLogMiddleware:
+    """Install :class:`SlowQueryLogger` on the default connection for each request."""
+
+    def __init__(self, get_response):
+        if not getattr(settings, "SLOW_QUERY_LOG_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with connection.execute_wrapper(SlowQueryLogger(request)):
+            return self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """Sample the stacks of a fraction of requests and aggregate them per URL name.
+
+    A request is profiled with probability ``PROFILING_SAMPLE_RATE`` or when it carries an
+    ``X-Profile-Token`` header matching ``PROFILING_TOKEN``. The token is a shared secret
+    because this runs before authentication: API users are resolved from their JWT inside
+    the DRF view, so ``request.user`` is not known here. Snapshots are written by a
+    :class:`ProfileDumper` thread. Disabled unless ``PROFILING_ENABLED``, in which case
+    Django drops it from the chain entirely.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = float(getattr(settings, "PROFILING_SAMPLE_RATE", 0))
+        self.token = getattr(settings, "PROFILING_TOKEN", "") or ""
+        self.interval = float(getattr(settings, "PROFILING_INTERVAL_MS", 5)) / 1000
+        self.store = ProfileStore(
+            max_endpoints=int(getattr(settings, "PROFILING_MAX_ENDPOINTS", 50)),
+            max_stacks=int(getattr(settings, "PROFILING_MAX_STACKS", 2000)),
+        )
+        self.dumper = ProfileDumper(
+            self.store,
+            getattr(settings, "PROFILING_DUMP_DIR", None),
+            every=int(getattr(settings, "PROFILING_DUMP_EVERY", 20)),
+            interval=float(getattr(settings, "PROFILING_DUMP_INTERVAL_S", 30)),
+        )
+
+    def __call__(self, request):
+        if not self._should_profile(request):
+            return self.get_response(request)
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        try:
+            return self.get_response(request)
+        finally:
+            samples = sampler.stop()
+            match = getattr(request, "resolver_match", None)
+            self.store.add((match.url_name if match else None) or "sin-ruta", samples)
+            self.dumper.notify()
+
+    def _should_profile(self, request) -> bool:
+        header = request.META.get("HTTP_X_PROFILE_TOKEN")
+        # WSGI entrega las cabeceras como latin-1; se comparan bytes para aceptar cualquier valor.
+        if header and self.token and hmac.compare_digest(header.encode("latin-1"), self.token.encode("utf-8")):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+class CircuitBreakerMiddleware:
+    """Turn :class:`CircuitOpenError` into a fast 503 instead of a 500."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, CircuitOpenError):
+            return None
+        response = JsonResponse({"detail": "Servicio temporalmente no disponible"}, status=503)
+        response["Retry-After"] = str(max(1, round(exception.retry_after)))
+        return response
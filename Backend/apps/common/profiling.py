@@ -0,0 +1,153 @@
+"""Sampling stack profiler used by :class:`apps.common.middleware.ProfilingMiddleware`."""
+
+import atexit
+import json
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_STACK_DEPTH = 128
+OVERFLOW_ENDPOINT = "[otros]"
+OVERFLOW_STACK = "[truncado]"
+
+
+def fold_stack(frame) -> str:
+    """Return ``frame``'s call stack, outermost first, in flamegraph "folded" notation."""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        labels.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class StackSampler:
+    """Sample the stack of one thread every ``interval`` seconds from a daemon thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[fold_stack(frame)] += 1
+            del frame
+
+
+class ProfileStore:
+    """Per-process folded stacks keyed by endpoint, bounded in endpoints and stacks per endpoint.
+
+    New endpoints beyond ``max_endpoints`` are merged into ``[otros]`` and new stacks beyond
+    ``max_stacks`` into ``[truncado]``, so memory stays bounded under any traffic mix.
+    """
+
+    def __init__(self, max_endpoints: int = 50, max_stacks: int = 2000):
+        self.max_endpoints = max_endpoints
+        self.max_stacks = max_stacks
+        self._profiles: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, samples: Counter) -> None:
+        with self._lock:
+            if endpoint not in self._profiles and len(self._profiles) >= self.max_endpoints:
+                endpoint = OVERFLOW_ENDPOINT
+            profile = self._profiles.setdefault(endpoint, {"requests": 0, "stacks": {}})
+            profile["requests"] += 1
+            stacks = profile["stacks"]
+            for stack, count in samples.items():
+                if stack not in stacks and len(stacks) >= self.max_stacks:
+                    stack = OVERFLOW_STACK
+                stacks[stack] = stacks.get(stack, 0) + count
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                endpoint: {"requests": profile["requests"], "stacks": dict(profile["stacks"])}
+                for endpoint, profile in self._profiles.items()
+            }
+
+    def dump(self, directory: Optional[str]) -> None:
+        """Write the snapshot to ``<directory>/profile-<pid>.json`` for ``export_profiles``."""
+        if not directory:
+            return
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        target = path / f"profile-{os.getpid()}.json"
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(json.dumps(self.snapshot()), encoding="utf-8")
+        os.replace(tmp, target)
+
+
+class ProfileDumper:
+    """Dump a :class:`ProfileStore` from a daemon thread, off the request path.
+
+    The snapshot is written every ``every`` profiled requests or ``interval`` seconds after
+    the last write, whichever comes first, and once more at interpreter exit. Write errors
+    are logged and retried on the next round.
+    """
+
+    def __init__(self, store: ProfileStore, directory: Optional[str], every: int = 20, interval: float = 30):
+        self.store = store
+        self.directory = directory
+        self.every = max(1, every)
+        self.interval = interval
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def notify(self) -> None:
+        """Record one profiled request; wakes the writer once ``every`` have accumulated."""
+        if not self.directory:
+            return
+        with self._lock:
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profile-dumper", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+            if self._pending >= self.every:
+                self._wake.set()
+
+    def flush(self) -> bool:
+        """Write the snapshot now if there are unsaved requests; return whether it was written."""
+        with self._lock:
+            pending, self._pending = self._pending, 0
+        if not pending:
+            return False
+        try:
+            with self._write_lock:
+                self.store.dump(self.directory)
+        except OSError as exc:
+            with self._lock:
+                self._pending += pending
+            logger.warning("profile_dump_failed", extra={"directory": str(self.directory), "error": str(exc)})
+            return False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
@@ -0,0 +1,109 @@
+"""Slow query logging through ``connection.execute_wrapper``."""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from hashlib import sha1
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+MAX_LOGGED_SQL = 2000
+
+_file_lock = threading.Lock()
+
+
+def fingerprint_sql(sql: str) -> str:
+    """Normalize ``sql`` so queries that differ only in literals or IN-list size group together."""
+    normalized = sql.replace("%s", "?")
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _IN_LIST_RE.sub("(?+)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    return sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+class SlowQueryLogger:
+    """Execute wrapper that records queries slower than ``SLOW_QUERY_THRESHOLD_MS``.
+
+    A ``SLOW_QUERY_EXPLAIN_SAMPLE_RATE`` fraction of slow SELECTs is also run through
+    the backend's EXPLAIN and stored with the entry in ``SLOW_QUERY_LOG_FILE``.
+    """
+
+    def __init__(self, request=None):
+        self.request = request
+        self.threshold_ms = float(getattr(settings, "SLOW_QUERY_THRESHOLD_MS", 200))
+        self.explain_rate = float(getattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0))
+        self.log_file = getattr(settings, "SLOW_QUERY_LOG_FILE", None)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms >= self.threshold_ms:
+                # El registro nunca debe reemplazar el resultado (o el error) de la consulta.
+                try:
+                    self._record(sql, params, many, context, duration_ms)
+                except Exception:
+                    logger.warning("slow_query_record_failed", exc_info=True)
+
+    def _view_name(self) -> str:
+        if self.request is None:
+            return ""
+        match = getattr(self.request, "resolver_match", None)
+        if match is not None and match.view_name:
+            return match.view_name
+        return self.request.path
+
+    def _record(self, sql: str, params, many: bool, context: Dict[str, Any], duration_ms: float) -> None:
+        fingerprint = fingerprint_sql(sql)
+        entry = {
+            "ts": timezone.now().isoformat(),
+            "fingerprint_id": fingerprint_id(fingerprint),
+            "fingerprint": fingerprint,
+            "duration_ms": round(duration_ms, 3),
+            "view": self._view_name(),
+            "sql": sql[:MAX_LOGGED_SQL],
+        }
+        if not many and self.explain_rate and sql.lstrip()[:6].upper() == "SELECT" and random.random() < self.explain_rate:
+            entry["explain"] = _explain(context["connection"], sql, params)
+
+        logger.warning(
+            "slow_query",
+            extra={key: entry[key] for key in ("fingerprint_id", "duration_ms", "view")},
+        )
+        if self.log_file:
+            try:
+                line = json.dumps(entry, ensure_ascii=False) + "\n"
+                with _file_lock, open(self.log_file, "a", encoding="utf-8") as handle:
+                    handle.write(line)
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("slow_query_log_write_failed", extra={"log_file": str(self.log_file), "error": str(exc)})
+
+
+def _explain(connection, sql: str, params) -> Optional[str]:
+    # Cursor crudo del backend: evita volver a pasar por los execute wrappers.
+    cursor = connection.create_cursor()
+    try:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+        return "\n".join(" ".join(str(value) for value in row) for row in cursor.fetchall())
+    except Exception as exc:
+        return f"EXPLAIN falló: {exc}"
+    finally:
+        cursor.close()
@@ -1,13 +1,46 @@
 ﻿"""Request helper utilities."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .iptrie import IPPrefixTrie, parse_ip
+
+
+@lru_cache(maxsize=8)
+def compile_networks(cidrs: Tuple[str, ...], value=True) -> IPPrefixTrie:
+    """Build (once per distinct list) the prefix trie for ``cidrs``."""
+    try:
+        return IPPrefixTrie.from_cidrs(cidrs, value)
+    except ValueError as exc:
+        raise ImproperlyConfigured(f"CIDR inválido: {exc}") from exc
 
 
 def get_client_ip(request) -> str:
-    """Return best-effort client IP using X-Forwarded-For then REMOTE_ADDR."""
+    """Return the client IP, trusting X-Forwarded-For only through ``TRUSTED_PROXIES``.
+
+    The forwarded chain is walked from the right starting at REMOTE_ADDR; the first hop
+    that is not a trusted proxy is the client. Entries left of it are client-supplied and
+    ignored, so they cannot be spoofed to dodge throttling or pollute audit logs.
+    """
+    cached: Optional[str] = getattr(request, "client_ip", None)
+    if cached is not None:
+        return cached
+
+    client = request.META.get("REMOTE_ADDR", "") or ""
+    trusted = compile_networks(tuple(getattr(settings, "TRUSTED_PROXIES", ())))
     x_forwarded_for: Optional[str] = request.META.get("HTTP_X_FORWARDED_FOR")
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(",")[0].strip()
-        if ip:
-            return ip
-    return request.META.get("REMOTE_ADDR", "") or ""
+    if not x_forwarded_for or not len(trusted) or client not in trusted:
+        return client
+
+    for hop in reversed(x_forwarded_for.split(",")):
+        hop = hop.strip()
+        if parse_ip(hop) is None:
+            # Entrada ilegible: nos quedamos con el último salto verificado.
+            break
+        client = hop
+        if hop not in trusted:
+            break
+    return client
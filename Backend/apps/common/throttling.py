@@ -0,0 +1,10 @@
+from rest_framework.throttling import AnonRateThrottle
+
+from .request import get_client_ip
+
+
+class ClientIPAnonRateThrottle(AnonRateThrottle):
+    """AnonRateThrottle keyed on :func:`get_client_ip` instead of the raw X-Forwarded-For header."""
+
+    def get_ident(self, request):
+        return get_client_ip(request)
@@ -0,0 +1,155 @@
+"""Helpers for the batch endpoint: sub-request building, dispatch and result references."""
+
+import json
+import re
+from io import BytesIO
+from typing import Any, Dict, List
+from urllib.parse import quote
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.urls import Resolver404, resolve
+from rest_framework.views import APIView
+
+from apps.common.request import get_client_ip
+
+ALLOWED_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+ALLOWED_PREFIX = "/api/v1/"
+REFERENCE_RE = re.compile(r"\{\{\s*(\d+)((?:\.[\w-]+)+)\s*\}\}")
+# Cabeceras que describen el cuerpo o el transporte del request padre, no del sub-request,
+# y las que identifican al cliente: su IP se resuelve una vez sobre el request padre.
+_DROPPED_META = (
+    "CONTENT_TYPE",
+    "CONTENT_LENGTH",
+    "HTTP_CONTENT_TYPE",
+    "HTTP_CONTENT_LENGTH",
+    "HTTP_TRANSFER_ENCODING",
+    "HTTP_X_FORWARDED_FOR",
+    "HTTP_X_REAL_IP",
+    "HTTP_FORWARDED",
+    "HTTP_COOKIE",
+)
+# Únicas cabeceras que un paso puede fijar; el resto se ignora.
+ALLOWED_STEP_HEADERS = {"authorization": "HTTP_AUTHORIZATION", "accept": "HTTP_ACCEPT", "accept-language": "HTTP_ACCEPT_LANGUAGE"}
+
+
+class BatchItemError(Exception):
+    """A sub-request that cannot be dispatched; reported as that item's response."""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def _lookup(results: List[Dict[str, Any]], index: int, dotted: str):
+    if index >= len(results):
+        raise BatchItemError(400, f"Referencia inválida: {{{{{index}{dotted}}}}} apunta a un paso posterior")
+    value: Any = results[index]
+    for key in dotted.lstrip(".").split("."):
+        if isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        elif isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            raise BatchItemError(400, f"Referencia inválida: {{{{{index}{dotted}}}}}")
+    return value
+
+
+def resolve_references(value, results: List[Dict[str, Any]], url: bool = False):
+    """Replace ``{{N.body.field}}`` placeholders with values from earlier responses.
+
+    A string that is exactly one placeholder takes the referenced value as-is (numbers,
+    objects); placeholders embedded in longer strings are interpolated as text. With
+    ``url`` every value is percent-encoded, so it cannot add path segments or query keys.
+    """
+    if isinstance(value, dict):
+        return {key: resolve_references(item, results, url) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, results, url) for item in value]
+    if not isinstance(value, str):
+        return value
+    if url:
+        return REFERENCE_RE.sub(
+            lambda match: quote(str(_lookup(results, int(match.group(1)), match.group(2))), safe=""), value
+        )
+    whole = REFERENCE_RE.fullmatch(value.strip())
+    if whole:
+        return _lookup(results, int(whole.group(1)), whole.group(2))
+    return REFERENCE_RE.sub(lambda match: str(_lookup(results, int(match.group(1)), match.group(2))), value)
+
+
+def resolve_item(item: Dict[str, Any], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Resolve the placeholders of one step, URL-encoding those inside ``path``."""
+    resolved = resolve_references({key: value for key, value in item.items() if key != "path"}, results)
+    if "path" in item:
+        resolved["path"] = resolve_references(item["path"], results, url=True)
+    return resolved
+
+
+def build_subrequest(parent, method: str, path: str, body, headers: Dict[str, str]) -> WSGIRequest:
+    """Build a request that inherits the client's connection metadata and resolved IP.
+
+    Only the headers in ``ALLOWED_STEP_HEADERS`` can be set per step, so a step cannot
+    forge X-Forwarded-For or cookies to pass as another client.
+    """
+    path_info, _, query_string = path.partition("?")
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    environ = {key: value for key, value in parent.META.items() if key not in _DROPPED_META}
+    environ.update(
+        {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path_info,
+            "SCRIPT_NAME": "",
+            "QUERY_STRING": query_string,
+            "wsgi.input": BytesIO(payload),
+        }
+    )
+    if payload:
+        environ["CONTENT_TYPE"] = "application/json"
+        environ["CONTENT_LENGTH"] = str(len(payload))
+    for name, value in headers.items():
+        key = ALLOWED_STEP_HEADERS.get(str(name).strip().lower())
+        if key:
+            environ[key] = str(value)
+    request = WSGIRequest(environ)
+    request.client_ip = get_client_ip(parent)
+    return request
+
+
+def dispatch(parent, item: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one sub-request through its DRF view and return ``{"status", "body"}``."""
+    method = str(item.get("method") or "GET").upper()
+    path = item.get("path")
+    headers = item.get("headers") or {}
+    if method not in ALLOWED_METHODS:
+        raise BatchItemError(400, f"Método no permitido: {method}")
+    if not isinstance(path, str) or not path.startswith(ALLOWED_PREFIX):
+        raise BatchItemError(400, f"path debe comenzar con {ALLOWED_PREFIX}")
+    if not isinstance(headers, dict):
+        raise BatchItemError(400, "headers debe ser un objeto")
+
+    try:
+        match = resolve(path.partition("?")[0])
+    except Resolver404:
+        raise BatchItemError(404, "No encontrado")
+    view_class = getattr(match.func, "cls", None)
+    # Solo vistas DRF: así cada sub-request pasa por su autenticación, permisos y throttling.
+    if view_class is None or not issubclass(view_class, APIView) or getattr(view_class, "batchable", True) is False:
+        raise BatchItemError(400, f"{path} no está disponible en batch")
+
+    request = build_subrequest(parent, method, path, item.get("body"), headers)
+    request.resolver_match = match
+    response = match.func(request, *match.args, **match.kwargs)
+    if getattr(response, "streaming", False):
+        response.close()
+        raise BatchItemError(400, f"{path} responde en streaming y no está disponible en batch")
+    if hasattr(response, "render"):
+        response.render()
+
+    body: Any = None
+    if response.content:
+        if response.get("Content-Type", "").startswith("application/json"):
+            body = json.loads(response.content)
+        else:
+            body = response.content.decode(response.charset or "utf-8", errors="replace")
+    return {"status": response.status_code, "body": body}
@@ -0,0 +1,136 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Se ejecuta en un intérprete nuevo por corrida para medir un worker en frío.
+PROBE_SCRIPT = """
+import json, sys, time
+from io import BytesIO
+
+started = time.perf_counter()
+from django.utils.module_loading import import_string
+application = import_string(sys.argv[1])
+# Igual que post_worker_init en gunicorn.conf.py.
+from django.conf import settings
+if settings.WARMUP_ON_STARTUP:
+    from apps.core.warmup import warm_database
+    warm_database()
+loaded = time.perf_counter()
+
+def request(path, host):
+    path_info, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET", "PATH_INFO": path_info, "QUERY_STRING": query, "SCRIPT_NAME": "",
+        "SERVER_NAME": host, "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1", "wsgi.input": BytesIO(), "wsgi.url_scheme": "http",
+        "wsgi.errors": sys.stderr, "wsgi.multithread": False, "wsgi.multiprocess": True, "wsgi.run_once": False,
+    }
+    status = []
+    response = application(environ, lambda s, h, exc_info=None: status.append(s))
+    b"".join(response)
+    getattr(response, "close", lambda: None)()
+    return status[0]
+
+status = request(sys.argv[2], sys.argv[3])
+first = time.perf_counter()
+request(sys.argv[2], sys.argv[3])
+second = time.perf_counter()
+print(json.dumps({
+    "load_ms": (loaded - started) * 1000,
+    "first_response_ms": (first - loaded) * 1000,
+    "second_response_ms": (second - first) * 1000,
+    "status": status,
+}))
+"""
+
+METRICS = ("process_ms", "load_ms", "first_response_ms", "second_response_ms")
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide el arranque de un worker WSGI en frío: carga de la aplicación (imports, django.setup, "
+        "warm-up) y tiempo hasta la primera respuesta."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5, help="Procesos a medir (default: 5).")
+        parser.add_argument("--path", default="/api/ping/", help="Ruta del primer request (default: /api/ping/).")
+        parser.add_argument("--host", default="localhost", help="Host del request; debe estar en ALLOWED_HOSTS.")
+        parser.add_argument("--no-warmup", action="store_true", help="Desactiva WARMUP_ON_STARTUP para comparar.")
+        parser.add_argument(
+            "--importtime",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Muestra los N módulos con mayor tiempo de import acumulado (python -X importtime).",
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            help="Falla si la mediana de carga + primera respuesta supera este valor.",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat debe ser mayor a 0")
+
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        if options["no_warmup"]:
+            env["WARMUP_ON_STARTUP"] = "0"
+        command = [sys.executable, "-c", PROBE_SCRIPT, settings.WSGI_APPLICATION, options["path"], options["host"]]
+
+        runs = []
+        import_lines = ""
+        for index in range(options["repeat"]):
+            want_importtime = options["importtime"] and index == 0
+            started = time.perf_counter()
+            result = subprocess.run(
+                [command[0], "-X", "importtime", *command[1:]] if want_importtime else command,
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            elapsed = (time.perf_counter() - started) * 1000
+            if result.returncode != 0:
+                raise CommandError(f"El worker de prueba falló:\n{result.stderr[-2000:]}")
+            run = json.loads(result.stdout.strip().splitlines()[-1])
+            run["process_ms"] = elapsed
+            runs.append(run)
+            if want_importtime:
+                import_lines = result.stderr
+
+        self.stdout.write(f"{len(runs)} corridas, GET {options['path']} -> {runs[0]['status']}")
+        medians = {}
+        for metric in METRICS:
+            values = [run[metric] for run in runs]
+            medians[metric] = statistics.median(values)
+            self.stdout.write(
+                f"  {metric:<20} min={min(values):8.1f}ms  mediana={medians[metric]:8.1f}ms  max={max(values):8.1f}ms"
+            )
+
+        if import_lines:
+            self._print_slowest_imports(import_lines, options["importtime"])
+
+        startup = medians["load_ms"] + medians["first_response_ms"]
+        budget = options["budget_ms"]
+        if budget is not None and startup > budget:
+            raise CommandError(f"Arranque hasta la primera respuesta: {startup:.1f}ms, supera el presupuesto de {budget:.1f}ms")
+        self.stdout.write(self.style.SUCCESS(f"Arranque hasta la primera respuesta (mediana): {startup:.1f}ms"))
+
+    def _print_slowest_imports(self, stderr: str, limit: int) -> None:
+        entries = []
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, module = line[len("import time:"):].split("|", 2)
+            entries.append((int(cumulative), module.strip()))
+        self.stdout.write(self.style.MIGRATE_HEADING("Imports más lentos (acumulado, primera corrida):"))
+        for cumulative, module in sorted(entries, reverse=True)[:limit]:
+            self.stdout.write(f"  {cumulative / 1000:8.1f}ms  {module}")
@@ -1,16 +1,28 @@
-﻿from django.core.management.base import BaseCommand, CommandError
+﻿from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
 from django.db import connection
 from django.db.utils import OperationalError
 
+from apps.common.circuit import CircuitOpenError, get_breaker, shared_state
+
 
 class Command(BaseCommand):
     help = "Verifica la conexion al motor configurado en DATABASES."
 
     def handle(self, *args, **options):
+        breaker = get_breaker(f"db:{connection.alias}")
         try:
             connection.ensure_connection()
+        except CircuitOpenError as exc:
+            raise CommandError(f"No se intento conectar a la base de datos: {exc!s}") from exc
         except OperationalError as exc:
-            raise CommandError(f"No se pudo conectar a la base de datos: {exc!s}") from exc
+            state = breaker.snapshot()
+            raise CommandError(
+                f"No se pudo conectar a la base de datos: {exc!s} "
+                f"(circuito {breaker.name}: {state['state']}, fallas: {state['failures']})"
+            ) from exc
 
         if not connection.is_usable():
             raise CommandError("La conexion se establecio pero no esta utilizable.")
@@ -20,3 +32,22 @@ class Command(BaseCommand):
             cursor.fetchone()
 
         self.stdout.write(self.style.SUCCESS("Conexion a la base de datos verificada correctamente."))
+        self._report_workers(breaker.name)
+
+    def _report_workers(self, name: str) -> None:
+        # El breaker de este proceso recien se crea; el de los workers se lee de la cache compartida.
+        entry = shared_state(name)
+        if entry is not None:
+            self.stdout.write(
+                f"Circuito {name} (workers): {entry['state']}, "
+                f"ultimo cambio hace {entry['age']:.0f}s en el proceso {entry['pid']}"
+            )
+            return
+        self.stdout.write(f"Circuito {name} (workers): sin cambios informados")
+        if isinstance(caches[getattr(settings, "CIRCUIT_BREAKER_CACHE", "default")], LocMemCache):
+            self.stdout.write(
+                self.style.WARNING(
+                    "CIRCUIT_BREAKER_CACHE usa memoria local: configure una cache compartida "
+                    "para ver el estado de los workers."
+                )
+            )
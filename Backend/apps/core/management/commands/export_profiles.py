@@ -0,0 +1,56 @@
+import json
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]")
+
+
+class Command(BaseCommand):
+    help = (
+        "Combina los perfiles muestreados por ProfilingMiddleware en todos los procesos y escribe un "
+        "archivo .folded por endpoint (compatible con flamegraph.pl y speedscope)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", help="Directorio con los volcados profile-<pid>.json (default: PROFILING_DUMP_DIR).")
+        parser.add_argument("--output", default="flamegraphs", help="Directorio de salida (default: flamegraphs).")
+        parser.add_argument("--endpoint", help="Exporta solo este nombre de URL (p. ej. auth-login).")
+        parser.add_argument("--clear", action="store_true", help="Borra los volcados después de exportarlos.")
+
+    def handle(self, *args, **options):
+        source = Path(options["dir"] or getattr(settings, "PROFILING_DUMP_DIR", "") or ".")
+        dumps = sorted(source.glob("profile-*.json"))
+        if not dumps:
+            raise CommandError(f"No hay perfiles en {source}")
+
+        requests = Counter()
+        stacks = defaultdict(Counter)
+        for dump in dumps:
+            for endpoint, profile in json.loads(dump.read_text(encoding="utf-8")).items():
+                if options["endpoint"] and endpoint != options["endpoint"]:
+                    continue
+                requests[endpoint] += profile["requests"]
+                stacks[endpoint].update(profile["stacks"])
+
+        if not requests:
+            raise CommandError(f"No hay muestras para {options['endpoint']}")
+
+        output = Path(options["output"])
+        output.mkdir(parents=True, exist_ok=True)
+        for endpoint in sorted(requests):
+            target = output / f"{UNSAFE_FILENAME_RE.sub('_', endpoint)}.folded"
+            with target.open("w", encoding="utf-8") as handle:
+                for stack, count in stacks[endpoint].most_common():
+                    handle.write(f"{stack} {count}\n")
+            self.stdout.write(
+                f"{endpoint}: {requests[endpoint]} requests, {sum(stacks[endpoint].values())} muestras -> {target}"
+            )
+
+        if options["clear"]:
+            for dump in dumps:
+                dump.unlink()
+        self.stdout.write(self.style.SUCCESS(f"Perfiles exportados en {output}."))
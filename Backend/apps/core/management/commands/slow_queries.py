@@ -0,0 +1,59 @@
+import json
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Muestra las consultas lentas registradas, agrupadas por fingerprint y ordenadas por tiempo total."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", help="Log a analizar (default: SLOW_QUERY_LOG_FILE).")
+        parser.add_argument("--top", type=int, default=10, help="Cantidad de fingerprints a mostrar (default: 10).")
+        parser.add_argument("--view", help="Solo consultas originadas en esta vista (p. ej. v1-accounts:auth-login).")
+        parser.add_argument("--explain", action="store_true", help="Incluye el último EXPLAIN capturado por fingerprint.")
+
+    def handle(self, *args, **options):
+        path = options["file"] or getattr(settings, "SLOW_QUERY_LOG_FILE", None)
+        if not path or not Path(path).is_file():
+            raise CommandError(f"No hay log de consultas lentas en {path}")
+
+        stats = {}
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if options["view"] and entry.get("view") != options["view"]:
+                    continue
+                item = stats.setdefault(
+                    entry["fingerprint_id"],
+                    {"fingerprint": entry["fingerprint"], "count": 0, "total_ms": 0.0, "max_ms": 0.0, "views": Counter(), "explain": None},
+                )
+                item["count"] += 1
+                item["total_ms"] += entry["duration_ms"]
+                item["max_ms"] = max(item["max_ms"], entry["duration_ms"])
+                item["views"][entry.get("view") or "-"] += 1
+                if entry.get("explain"):
+                    item["explain"] = entry["explain"]
+
+        if not stats:
+            self.stdout.write("No hay consultas lentas registradas.")
+            return
+
+        ranking = sorted(stats.items(), key=lambda pair: pair[1]["total_ms"], reverse=True)[: options["top"]]
+        for position, (fid, item) in enumerate(ranking, start=1):
+            view, _ = item["views"].most_common(1)[0]
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"{position}. [{fid}] total={item['total_ms']:.1f}ms n={item['count']} "
+                    f"prom={item['total_ms'] / item['count']:.1f}ms max={item['max_ms']:.1f}ms vista={view}"
+                )
+            )
+            self.stdout.write(f"   {item['fingerprint']}")
+            if options["explain"] and item["explain"]:
+                for explain_line in item["explain"].splitlines():
+                    self.stdout.write(f"   | {explain_line}")
@@ -0,0 +1,117 @@
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from apps.core.batch import build_subrequest, resolve_item
+
+URL = "/api/v1/batch/"
+REGISTER = {
+    "nombre_completo": "Josefa Méndez",
+    "email": "josefa@example.com",
+    "password": "Clave#2025",
+    "password2": "Clave#2025",
+}
+
+
+class BatchEndpointTest(TestCase):
+    def post(self, payload):
+        return self.client.post(URL, payload, content_type="application/json")
+
+    def test_register_login_and_authenticated_step_with_references(self):
+        response = self.post({
+            "requests": [
+                {"method": "POST", "path": "/api/v1/auth/register/", "body": REGISTER},
+                {"method": "POST", "path": "/api/v1/auth/login/", "body": {"email": REGISTER["email"], "password": REGISTER["password"]}},
+                {
+                    "method": "GET",
+                    "path": "/api/v1/accounts/export/",
+                    "headers": {"Authorization": "Bearer {{1.body.access}}"},
+                },
+                {"method": "GET", "path": "/api/v1/auth/password/reset/validate/?token={{1.body.user.email}}"},
+            ],
+            "stop_on_error": False,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        statuses = [item["status"] for item in response.json()["responses"]]
+        self.assertEqual(statuses, [201, 200, 400, 400])
+        responses = response.json()["responses"]
+        self.assertEqual(responses[1]["body"]["user"]["email"], "josefa@example.com")
+        self.assertEqual(responses[2]["body"], {"detail": "/api/v1/accounts/export/ no está disponible en batch"})
+        self.assertEqual(responses[3]["body"], {"detail": "Token inválido o expirado"})
+
+    def test_stops_after_failed_step(self):
+        response = self.post({
+            "requests": [
+                {"method": "POST", "path": "/api/v1/auth/login/", "body": {"email": "nadie@example.com", "password": "x"}},
+                {"method": "POST", "path": "/api/v1/auth/register/", "body": REGISTER},
+            ]
+        })
+        statuses = [item["status"] for item in response.json()["responses"]]
+        self.assertEqual(statuses, [400, 424])
+
+    def test_stop_on_error_must_be_a_boolean(self):
+        step = {"method": "POST", "path": "/api/v1/auth/login/", "body": {"email": "nadie@example.com", "password": "x"}}
+        response = self.post({"requests": [step, step], "stop_on_error": "false"})
+        self.assertEqual([item["status"] for item in response.json()["responses"]], [400, 400])
+
+        response = self.post({"requests": [step], "stop_on_error": "quizás"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("stop_on_error", response.json())
+
+    def test_sub_requests_are_throttled(self):
+        with override_settings(BATCH_MAX_REQUESTS=20):
+            response = self.post({
+                "requests": [{"method": "GET", "path": "/api/v1/auth/password/reset/validate/?token=x"}] * 11,
+                "stop_on_error": False,
+            })
+        statuses = [item["status"] for item in response.json()["responses"]]
+        self.assertEqual(statuses[-1], 429)
+
+    @override_settings(BATCH_MAX_REQUESTS=2)
+    def test_rejects_oversized_and_invalid_batches(self):
+        step = {"method": "GET", "path": "/api/v1/auth/password/reset/validate/?token=x"}
+        self.assertEqual(self.post({"requests": [step] * 3}).status_code, 400)
+        self.assertEqual(self.post({"requests": []}).status_code, 400)
+
+        responses = self.post({
+            "requests": [{"method": "POST", "path": URL, "body": {"requests": [step]}}, {"path": "/admin/"}],
+            "stop_on_error": False,
+        }).json()["responses"]
+        self.assertEqual([item["status"] for item in responses], [400, 400])
+
+
+class ResolveItemTest(SimpleTestCase):
+    def test_path_values_are_percent_encoded_and_body_values_kept(self):
+        results = [{"status": 200, "body": {"token": "a b&admin=1/../x", "id": 7}}]
+        item = resolve_item(
+            {"path": "/api/v1/items/{{0.body.id}}/?token={{0.body.token}}", "body": {"id": "{{0.body.id}}"}},
+            results,
+        )
+        self.assertEqual(item["path"], "/api/v1/items/7/?token=a%20b%26admin%3D1%2F..%2Fx")
+        self.assertEqual(item["body"], {"id": 7})
+
+
+class BuildSubrequestTest(SimpleTestCase):
+    @override_settings(TRUSTED_PROXIES=["10.0.0.0/8"])
+    def test_only_allowlisted_step_headers_and_parent_client_ip(self):
+        parent = RequestFactory().post(
+            URL, REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="198.51.100.7", HTTP_COOKIE="sessionid=padre"
+        )
+        request = build_subrequest(
+            parent,
+            "GET",
+            "/api/v1/",
+            None,
+            {
+                "Authorization": "Bearer abc",
+                "accept-language": "es",
+                "X-Forwarded-For": "6.6.6.6",
+                "X-Real-IP": "6.6.6.6",
+                "Cookie": "sessionid=otro",
+            },
+        )
+
+        self.assertEqual(request.client_ip, "198.51.100.7")
+        self.assertEqual(request.META["HTTP_AUTHORIZATION"], "Bearer abc")
+        self.assertEqual(request.META["HTTP_ACCEPT_LANGUAGE"], "es")
+        for key in ("HTTP_X_FORWARDED_FOR", "HTTP_X_REAL_IP", "HTTP_COOKIE"):
+            self.assertNotIn(key, request.META)
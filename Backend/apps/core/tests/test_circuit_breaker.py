@@ -0,0 +1,173 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.accounts.models import PasswordResetRequest
+from apps.common.circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_breaker,
+    publish_state,
+    shared_state,
+)
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError("smtp caído")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail():
+    raise OSError("timeout")
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    def test_opens_after_threshold_and_recovers_through_half_open_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=10, clock=clock)
+
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                breaker.call(_fail)
+        self.assertEqual(breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.call(lambda: "ok")
+
+        clock.now = 10
+        self.assertEqual(breaker.state, HALF_OPEN)
+        with self.assertRaises(OSError):
+            breaker.call(_fail)
+        self.assertEqual(breaker.state, OPEN)
+
+        clock.now = 20
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_check_rejects_while_open_without_using_the_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.check()
+        with self.assertRaises(OSError):
+            breaker.call(_fail)
+        with self.assertRaises(CircuitOpenError):
+            breaker.check()
+
+        clock.now = 10
+        breaker.check()
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+
+    def test_listener_sees_open_and_close_transitions(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10, clock=clock, listener=publish_state)
+        self.assertIsNone(shared_state("test"))
+        with self.assertRaises(OSError):
+            breaker.call(_fail)
+        self.assertEqual(shared_state("test")["state"], OPEN)
+
+        clock.now = 10
+        breaker.call(lambda: "ok")
+        self.assertEqual(shared_state("test")["state"], CLOSED)
+
+    def test_base_exception_during_probe_releases_it(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10, clock=clock)
+        with self.assertRaises(OSError):
+            breaker.call(_fail)
+
+        clock.now = 10
+
+        def _interrupt():
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            breaker.call(_interrupt)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(breaker.state, CLOSED)
+
+
+@override_settings(
+    EMAIL_BACKEND="apps.common.mail.CircuitBreakerEmailBackend",
+    CIRCUIT_BREAKER_EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+class CircuitBreakerIntegrationTest(TestCase):
+    URL = "/api/v1/auth/password/forgot/"
+
+    def setUp(self):
+        get_user_model().objects.create_user(username="cliente@x.com", email="cliente@x.com", password="Clave#2025")
+        self.smtp = get_breaker("smtp")
+        self.smtp.reset()
+        self.addCleanup(self.smtp.reset)
+
+    def test_mail_goes_through_breaker_when_closed(self):
+        response = self.client.post(self.URL, {"email": "cliente@x.com"}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_open_breaker_fails_fast_with_503(self):
+        with override_settings(CIRCUIT_BREAKER_EMAIL_BACKEND="apps.core.tests.test_circuit_breaker.FailingEmailBackend"):
+            for _ in range(self.smtp.failure_threshold):
+                with self.assertRaises(ConnectionRefusedError):
+                    mail.send_mail("x", "y", None, ["cliente@x.com"])
+
+        response = self.client.post(self.URL, {"email": "cliente@x.com"}, content_type="application/json")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"detail": "Servicio temporalmente no disponible"})
+        self.assertIn("Retry-After", response)
+
+        metrics = self.client.get("/api/metrics/").json()
+        self.assertEqual(metrics["circuit_breakers"]["smtp"]["state"], OPEN)
+
+    def test_open_breaker_answers_alike_without_touching_tokens(self):
+        PasswordResetRequest.create_for_user(get_user_model().objects.get(), ip="", user_agent="")
+        with override_settings(CIRCUIT_BREAKER_EMAIL_BACKEND="apps.core.tests.test_circuit_breaker.FailingEmailBackend"):
+            for _ in range(self.smtp.failure_threshold):
+                with self.assertRaises(ConnectionRefusedError):
+                    mail.send_mail("x", "y", None, ["cliente@x.com"])
+
+        known = self.client.post(self.URL, {"email": "cliente@x.com"}, content_type="application/json")
+        unknown = self.client.post(self.URL, {"email": "nadie@x.com"}, content_type="application/json")
+        self.assertEqual((known.status_code, unknown.status_code), (503, 503))
+        self.assertEqual(known.json(), unknown.json())
+        self.assertEqual(PasswordResetRequest.objects.count(), 1)
+        self.assertFalse(PasswordResetRequest.objects.filter(used_at__isnull=False).exists())
+
+    def test_metrics_requires_staff_or_internal_network(self):
+        self.assertEqual(self.client.get("/api/metrics/", REMOTE_ADDR="203.0.113.5").status_code, 403)
+
+        staff = get_user_model().objects.create_user(username="staff@x.com", password="Clave#2025", is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get("/api/metrics/", REMOTE_ADDR="203.0.113.5").status_code, 200)
+
+    def test_transitions_are_published_to_the_shared_cache(self):
+        with override_settings(CIRCUIT_BREAKER_EMAIL_BACKEND="apps.core.tests.test_circuit_breaker.FailingEmailBackend"):
+            for _ in range(self.smtp.failure_threshold):
+                with self.assertRaises(ConnectionRefusedError):
+                    mail.send_mail("x", "y", None, ["cliente@x.com"])
+        self.assertEqual(shared_state("smtp")["state"], OPEN)
+
+    def test_check_db_reports_state_published_by_workers(self):
+        out = StringIO()
+        call_command("check_db", stdout=out)
+        self.assertIn("Circuito db:default (workers): sin cambios informados", out.getvalue())
+
+        # Otro proceso (un worker web) abrió su breaker de base de datos.
+        publish_state(CircuitBreaker("db:default", reset_timeout=60), OPEN)
+        out = StringIO()
+        call_command("check_db", stdout=out)
+        self.assertIn("Circuito db:default (workers): open", out.getvalue())
@@ -0,0 +1,128 @@
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from apps.accounts.models import PasswordResetRequest
+from apps.common.iptrie import IPPrefixTrie
+from apps.common.request import get_client_ip
+from apps.common.throttling import ClientIPAnonRateThrottle
+
+
+class IPPrefixTrieTest(SimpleTestCase):
+    def test_longest_prefix_wins(self):
+        trie = IPPrefixTrie()
+        trie.insert("10.0.0.0/8", "deny")
+        trie.insert("10.1.2.0/24", "allow")
+        trie.insert("2001:db8::/32", "deny")
+
+        self.assertEqual(trie.lookup("10.9.9.9"), "deny")
+        self.assertEqual(trie.lookup("10.1.2.3"), "allow")
+        self.assertEqual(trie.lookup("::ffff:10.1.2.3"), "allow")
+        self.assertEqual(trie.lookup("2001:db8::1"), "deny")
+        self.assertIsNone(trie.lookup("192.168.0.1"))
+        self.assertIsNone(trie.lookup("no-es-una-ip"))
+        self.assertEqual(len(trie), 3)
+
+    def test_default_route_and_host_entries(self):
+        trie = IPPrefixTrie.from_cidrs(["0.0.0.0/0"], "any")
+        trie.insert("203.0.113.7", "host")
+        self.assertEqual(trie.lookup("203.0.113.7"), "host")
+        self.assertEqual(trie.lookup("198.51.100.1"), "any")
+        self.assertNotIn("::1", trie)
+
+
+class ClientIPTest(SimpleTestCase):
+    factory = RequestFactory()
+
+    def _request(self, remote_addr, xff=None):
+        extra = {"REMOTE_ADDR": remote_addr}
+        if xff is not None:
+            extra["HTTP_X_FORWARDED_FOR"] = xff
+        return self.factory.get("/", **extra)
+
+    def test_forwarded_header_ignored_without_trusted_proxies(self):
+        self.assertEqual(get_client_ip(self._request("198.51.100.9", "1.2.3.4")), "198.51.100.9")
+
+    @override_settings(TRUSTED_PROXIES=["10.0.0.0/8"])
+    def test_walks_chain_from_the_right(self):
+        # El cliente inventa 1.2.3.4; el balanceador agrega la IP real que vio.
+        request = self._request("10.0.0.2", "1.2.3.4, 203.0.113.5, 10.0.0.7")
+        self.assertEqual(get_client_ip(request), "203.0.113.5")
+
+        self.assertEqual(get_client_ip(self._request("198.51.100.9", "1.2.3.4")), "198.51.100.9")
+        self.assertEqual(get_client_ip(self._request("10.0.0.2", "basura, 10.0.0.7")), "10.0.0.7")
+
+    @override_settings(TRUSTED_PROXIES=["10.0.0.0/8"])
+    def test_throttle_uses_resolved_ip(self):
+        request = self._request("10.0.0.2", "1.2.3.4, 203.0.113.5")
+        self.assertEqual(ClientIPAnonRateThrottle().get_ident(request), "203.0.113.5")
+
+
+class IPFilterMiddlewareTest(TestCase):
+    def test_denied_networks_get_403_before_the_view(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            abusive = Path(tmp) / "abusivas.txt"
+            abusive.write_text("# rangos conocidos\n203.0.113.0/24\n", encoding="utf-8")
+            with override_settings(
+                IP_DENYLIST=["198.51.100.0/24"],
+                IP_DENYLIST_FILE=str(abusive),
+                IP_ALLOWLIST=["198.51.100.10"],
+                TRUSTED_PROXIES=["127.0.0.1"],
+            ):
+                blocked = self.client.get("/api/ping/", REMOTE_ADDR="198.51.100.3")
+                listed = self.client.get("/api/ping/", REMOTE_ADDR="127.0.0.1", HTTP_X_FORWARDED_FOR="203.0.113.9")
+                allowed = self.client.get("/api/ping/", REMOTE_ADDR="198.51.100.10")
+                spoofed = self.client.get("/api/ping/", REMOTE_ADDR="198.51.100.3", HTTP_X_FORWARDED_FOR="8.8.8.8")
+
+        self.assertEqual(blocked.status_code, 403)
+        self.assertEqual(blocked.json(), {"detail": "Acceso denegado"})
+        self.assertEqual(listed.status_code, 403)
+        self.assertEqual(allowed.status_code, 200)
+        self.assertEqual(spoofed.status_code, 403)
+
+    @override_settings(IP_FILTER_DEFAULT="deny", IP_ALLOWLIST=["127.0.0.0/8"])
+    def test_default_deny_only_admits_allowlist(self):
+        self.assertEqual(self.client.get("/api/ping/").status_code, 200)
+        self.assertEqual(self.client.get("/api/ping/", REMOTE_ADDR="192.0.2.1").status_code, 403)
+
+
+@override_settings(TRUSTED_PROXIES=["127.0.0.1"], BATCH_MAX_REQUESTS=20)
+class BatchSpoofedForwardedForTest(TestCase):
+    """A batch step cannot override the client IP resolved for the outer request."""
+
+    def post_batch(self, steps):
+        return self.client.post(
+            "/api/v1/batch/",
+            {"requests": steps, "stop_on_error": False},
+            content_type="application/json",
+            REMOTE_ADDR="127.0.0.1",
+            HTTP_X_FORWARDED_FOR="198.51.100.7",
+        )
+
+    def test_audit_ip_ignores_step_forwarded_for(self):
+        get_user_model().objects.create_user(username="cliente@x.com", email="cliente@x.com", password="Clave#2025")
+        response = self.post_batch([
+            {
+                "method": "POST",
+                "path": "/api/v1/auth/password/forgot/",
+                "body": {"email": "cliente@x.com"},
+                "headers": {"X-Forwarded-For": "6.6.6.6", "X-Real-IP": "6.6.6.6"},
+            }
+        ])
+
+        self.assertEqual(response.json()["responses"][0]["status"], 200)
+        self.assertEqual(PasswordResetRequest.objects.get().ip, "198.51.100.7")
+
+    def test_throttling_ignores_step_forwarded_for(self):
+        steps = [
+            {
+                "method": "GET",
+                "path": "/api/v1/auth/password/reset/validate/?token=x",
+                "headers": {"X-Forwarded-For": f"6.6.6.{index}"},
+            }
+            for index in range(11)
+        ]
+        statuses = [item["status"] for item in self.post_batch(steps).json()["responses"]]
+        self.assertEqual(statuses[-1], 429)
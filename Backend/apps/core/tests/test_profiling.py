@@ -0,0 +1,114 @@
+import tempfile
+import threading
+import time
+from collections import Counter
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.common.profiling import ProfileDumper, ProfileStore, StackSampler
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class StackSamplerTest(SimpleTestCase):
+    def test_samples_target_thread_stacks(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_loop, args=(stop,))
+        worker.start()
+        sampler = StackSampler(worker.ident, interval=0.001)
+        sampler.start()
+        time.sleep(0.05)
+        samples = sampler.stop()
+        stop.set()
+        worker.join()
+
+        self.assertTrue(samples)
+        self.assertTrue(any(stack.endswith(f"{__name__}:_busy_loop") for stack in samples))
+
+    def test_store_is_bounded(self):
+        store = ProfileStore(max_endpoints=1, max_stacks=1)
+        store.add("auth-login", Counter({"a;b": 2, "a;c": 1}))
+        store.add("auth-register", Counter({"a;d": 1}))
+
+        snapshot = store.snapshot()
+        self.assertEqual(snapshot["auth-login"]["stacks"], {"a;b": 2, "[truncado]": 1})
+        self.assertEqual(snapshot["[otros]"], {"requests": 1, "stacks": {"a;d": 1}})
+
+
+class ProfileDumperTest(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def test_flush_writes_only_pending_snapshots(self):
+        store = ProfileStore()
+        dumper = ProfileDumper(store, str(self.tmp / "dumps"), every=100, interval=3600)
+        self.assertFalse(dumper.flush())
+
+        store.add("ping", Counter({"a;b": 1}))
+        dumper.notify()
+        self.assertTrue(dumper.flush())
+        self.assertEqual(len(list((self.tmp / "dumps").glob("profile-*.json"))), 1)
+        self.assertFalse(dumper.flush())
+
+    def test_write_errors_are_logged_not_raised(self):
+        blocker = self.tmp / "archivo"
+        blocker.write_text("", encoding="utf-8")
+        store = ProfileStore()
+        dumper = ProfileDumper(store, str(blocker / "dumps"), every=100, interval=3600)
+        store.add("ping", Counter({"a;b": 1}))
+        dumper.notify()
+
+        with self.assertLogs("apps.common.profiling", level="WARNING") as logs:
+            self.assertFalse(dumper.flush())
+        self.assertIn("profile_dump_failed", logs.output[0])
+
+
+class ProfilingMiddlewareTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def test_token_header_profiles_request_and_command_exports_folded_files(self):
+        with override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SAMPLE_RATE=0,
+            PROFILING_TOKEN="secreto",
+            PROFILING_INTERVAL_MS=1,
+            PROFILING_DUMP_DIR=str(self.tmp / "dumps"),
+            PROFILING_DUMP_EVERY=1,
+        ):
+            self.client.get("/api/ping/", HTTP_X_PROFILE_TOKEN="otro")
+            self.assertFalse((self.tmp / "dumps").exists())
+            response = self.client.get("/api/ping/", HTTP_X_PROFILE_TOKEN="secreto")
+        self.assertEqual(response.status_code, 200)
+
+        # El volcado ocurre en el hilo del dumper, fuera del request.
+        deadline = time.monotonic() + 5
+        while not list((self.tmp / "dumps").glob("profile-*.json")) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        out = StringIO()
+        call_command("export_profiles", "--dir", str(self.tmp / "dumps"), "--output", str(self.tmp / "out"), stdout=out)
+        self.assertIn("ping: 1 requests", out.getvalue())
+        self.assertTrue((self.tmp / "out" / "ping.folded").exists())
+
+    def test_non_ascii_token_header_is_not_profiled(self):
+        with override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SAMPLE_RATE=0,
+            PROFILING_TOKEN="secreto",
+            PROFILING_DUMP_DIR=str(self.tmp / "dumps"),
+            PROFILING_DUMP_EVERY=1,
+        ):
+            response = self.client.get("/api/ping/", HTTP_X_PROFILE_TOKEN="\xf1")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse((self.tmp / "dumps").exists())
@@ -0,0 +1,59 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.common.querylog import fingerprint_sql
+
+
+class FingerprintTest(TestCase):
+    def test_literals_and_in_lists_are_normalized(self):
+        a = fingerprint_sql('SELECT "id" FROM "auth_user" WHERE "id" IN (%s, %s, %s) AND "email" = \'a@b.com\'')
+        b = fingerprint_sql('SELECT "id"  FROM "auth_user"\nWHERE "id" IN (%s) AND "email" = \'x@y.com\' LIMIT 21')
+        self.assertEqual(a, 'SELECT "id" FROM "auth_user" WHERE "id" IN (?+) AND "email" = ?')
+        self.assertEqual(b, 'SELECT "id" FROM "auth_user" WHERE "id" IN (?) AND "email" = ? LIMIT ?')
+
+
+class SlowQueryLogTest(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log_file = Path(tmp.name) / "slow.jsonl"
+
+    def test_middleware_logs_queries_and_command_ranks_them(self):
+        with override_settings(
+            SLOW_QUERY_LOG_ENABLED=True,
+            SLOW_QUERY_THRESHOLD_MS=0,
+            SLOW_QUERY_EXPLAIN_SAMPLE_RATE=1.0,
+            SLOW_QUERY_LOG_FILE=str(self.log_file),
+        ):
+            response = self.client.post(
+                "/api/v1/auth/password/forgot/", {"email": "nadie@example.com"}, content_type="application/json"
+            )
+        self.assertEqual(response.status_code, 200)
+
+        entries = [json.loads(line) for line in self.log_file.read_text(encoding="utf-8").splitlines()]
+        user_lookup = next(e for e in entries if '"auth_user"' in e["fingerprint"])
+        self.assertEqual(user_lookup["view"], "v1-accounts:auth-password-forgot")
+        self.assertIn("explain", user_lookup)
+
+        out = StringIO()
+        call_command("slow_queries", "--file", str(self.log_file), "--explain", stdout=out)
+        self.assertIn("vista=v1-accounts:auth-password-forgot", out.getvalue())
+        self.assertIn('FROM "auth_user"', out.getvalue())
+
+    def test_unwritable_log_file_does_not_break_the_request(self):
+        unwritable = Path(self.log_file.parent) / "no-existe" / "slow.jsonl"
+        with override_settings(
+            SLOW_QUERY_LOG_ENABLED=True, SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_LOG_FILE=str(unwritable)
+        ):
+            with self.assertLogs("apps.common.querylog", level="WARNING") as logs:
+                response = self.client.post(
+                    "/api/v1/auth/password/forgot/", {"email": "nadie@example.com"}, content_type="application/json"
+                )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("slow_query_log_write_failed", "\n".join(logs.output))
+        self.assertFalse(unwritable.exists())
@@ -0,0 +1,28 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from apps.core.warmup import STEPS, warm_up
+
+
+class WarmUpTest(SimpleTestCase):
+    # SimpleTestCase rechaza consultas: ningún paso puede abrir la base antes del fork.
+    def test_all_steps_run_without_errors_or_database_access(self):
+        with self.assertNoLogs("apps.core.warmup", level="WARNING"):
+            timings = warm_up()
+        self.assertEqual(list(timings), [name for name, _ in STEPS])
+
+
+class UrlConfTest(TestCase):
+    def test_core_routes_are_not_duplicated_under_v1(self):
+        self.assertEqual(self.client.get("/api/v1/").status_code, 200)
+        self.assertEqual(self.client.get("/api/v1/api/ping/").status_code, 404)
+
+
+class BenchStartupCommandTest(TestCase):
+    def test_reports_load_and_first_response(self):
+        out = StringIO()
+        call_command("bench_startup", "--repeat", "1", "--no-warmup", stdout=out)
+        self.assertIn("GET /api/ping/ -> 200 OK", out.getvalue())
+        self.assertIn("first_response_ms", out.getvalue())
@@ -1,10 +1,9 @@
 ﻿from django.urls import path
-from .views import ping, api_v1_root
+from .views import metrics, ping
 
+# Rutas fuera de la versión; la raíz de la API v1 está en urls_v1.py.
 urlpatterns = [
     # healthcheck fuera de la versión
     path("api/ping/", ping, name="ping"),
-
-    # raíz de la API v1 (mapita). OJO: esto se incluye bajo /api/v1/
-    path("", api_v1_root, name="api-v1-root"),
+    path("api/metrics/", metrics, name="metrics"),
 ]
@@ -1,14 +1,82 @@
-﻿from django.http import JsonResponse
+﻿from django.conf import settings
+from django.http import JsonResponse
+from rest_framework import permissions, serializers, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.circuit import breaker_states
+from apps.common.request import compile_networks, get_client_ip
+
+from .batch import BatchItemError, dispatch, resolve_item
 
 def ping(_request):
     return JsonResponse({"status": "ok"})
 
+def metrics(request):
+    """Circuit breaker states; only for staff users or clients in ``METRICS_ALLOWED_NETWORKS``."""
+    internal = compile_networks(tuple(getattr(settings, "METRICS_ALLOWED_NETWORKS", ())))
+    user = getattr(request, "user", None)
+    if not (user is not None and user.is_staff) and get_client_ip(request) not in internal:
+        return JsonResponse({"detail": "No autorizado"}, status=403)
+    return JsonResponse({"circuit_breakers": breaker_states()})
+
 def api_v1_root(_request):
     return JsonResponse({
         "version": "v1",
         "endpoints": {
             "ping": "/api/ping/",
             "register": "/api/v1/auth/register/",
+            "batch": "/api/v1/batch/",
             # "login": "/api/v1/auth/login/",  # cuando exista
         }
     })
+
+
+class BatchView(APIView):
+    """Run an ordered list of sub-requests against the v1 API in a single round trip.
+
+    Each sub-request is dispatched to its DRF view with the client's headers, so
+    authentication, permissions and throttling apply per step. A step can use an
+    earlier response through ``{{N.body.field}}`` placeholders.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    # El throttling se cuenta en cada sub-request, no en el sobre.
+    throttle_classes = []
+    batchable = False
+
+    def post(self, request, *args, **kwargs):
+        max_body = getattr(settings, "BATCH_MAX_BODY_BYTES", 256 * 1024)
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_body:
+            return Response({"detail": f"El batch supera los {max_body} bytes"}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        items = request.data.get("requests") if isinstance(request.data, dict) else None
+        max_requests = getattr(settings, "BATCH_MAX_REQUESTS", 10)
+        if not isinstance(items, list) or not items:
+            return Response({"requests": ["Debe ser una lista no vacía"]}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > max_requests:
+            return Response({"requests": [f"Máximo {max_requests} sub-requests por batch"]}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            stop_on_error = serializers.BooleanField().to_internal_value(request.data.get("stop_on_error", True))
+        except serializers.ValidationError as exc:
+            return Response({"stop_on_error": exc.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = []
+        failed = False
+        for item in items:
+            if failed and stop_on_error:
+                results.append({"status": status.HTTP_424_FAILED_DEPENDENCY, "body": {"detail": "Omitido por un error previo"}})
+                continue
+            try:
+                if not isinstance(item, dict):
+                    raise BatchItemError(400, "Cada sub-request debe ser un objeto")
+                result = dispatch(request._request, resolve_item(item, results))
+            except BatchItemError as exc:
+                result = {"status": exc.status, "body": {"detail": exc.detail}}
+            results.append(result)
+            failed = failed or result["status"] >= 400
+        return Response({"responses": results}, status=status.HTTP_200_OK)
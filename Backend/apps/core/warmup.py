@@ -0,0 +1,94 @@
+"""Worker warm-up: prime per-process caches before the first real request."""
+
+import logging
+import time
+from typing import Dict
+
+from django.conf import settings
+from django.db import connection
+from django.urls import URLResolver, get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def _compile_patterns(patterns) -> None:
+    for pattern in patterns:
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            _compile_patterns(pattern.url_patterns)
+
+
+def _warm_urls() -> None:
+    resolver = get_resolver()
+    _compile_patterns(resolver.url_patterns)
+    resolver.reverse_dict
+    for namespace in resolver.namespace_dict.values():
+        namespace[1].reverse_dict
+
+
+def _warm_hashers() -> None:
+    from django.contrib.auth.hashers import get_hasher, get_hashers
+
+    get_hashers()
+    get_hasher("default")
+
+
+def _warm_jwt() -> None:
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    token = str(AccessToken())
+    JWTAuthentication().get_validated_token(token)
+
+
+def _warm_serializers() -> None:
+    # Los validadores de Django compilan sus regex (EmailValidator) y cargan los catálogos de
+    # mensajes en el primer uso. El email inválido corta el registro antes de validate_email,
+    # así que ninguna de las dos validaciones consulta la base.
+    from apps.accounts import serializers
+
+    serializers.ForgotPasswordSerializer(data={"email": "warmup@example.com"}).is_valid()
+    serializers.RegisterSerializer(
+        data={"nombre_completo": "Warm Up", "email": "warmup", "password": "Clave#2025", "password2": "Clave#2025"}
+    ).is_valid()
+
+
+STEPS = (
+    ("urls", _warm_urls),
+    ("hashers", _warm_hashers),
+    ("jwt", _warm_jwt),
+    ("serializers", _warm_serializers),
+)
+
+
+def warm_up() -> Dict[str, float]:
+    """Run every warm-up step and return its duration in milliseconds.
+
+    No step opens a socket, so this is safe to run before the server forks its workers.
+    A failing step is logged and skipped: warm-up must never keep a worker from starting.
+    """
+    timings = {}
+    for name, step in STEPS:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.warning("worker_warmup_failed", extra={"step": name}, exc_info=True)
+        timings[name] = round((time.perf_counter() - started) * 1000, 2)
+    logger.info("worker_warmup", extra={"timings_ms": timings})
+    return timings
+
+
+def warm_database() -> None:
+    """Open the default connection (``WARMUP_DATABASE``) for the first request to reuse.
+
+    Django connections belong to the thread that opens them, so this must run in the
+    worker process, after the fork, on the thread that serves requests: gunicorn's
+    ``post_worker_init`` with sync workers (see ``gunicorn.conf.py``).
+    """
+    if not getattr(settings, "WARMUP_DATABASE", True):
+        return
+    try:
+        connection.ensure_connection()
+    except Exception:
+        logger.warning("worker_warmup_failed", extra={"step": "database"}, exc_info=True)
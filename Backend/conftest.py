@@ -0,0 +1,8 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_throttle_history():
+    # Los throttles de DRF guardan el historial en la cache; sin limpiarla, los tests se limitan entre sí.
+    cache.clear()
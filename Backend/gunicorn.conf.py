@@ -0,0 +1,26 @@
+"""Gunicorn configuration: ``gunicorn -c gunicorn.conf.py``.
+
+Supported mode: sync workers (one request thread per process), with or without
+``preload_app``. ``panaderia.wsgi`` warms everything but the database when imported and
+closes any connection it opened, so the master never hands a socket to its workers;
+each worker opens its own connection in ``post_worker_init``.
+"""
+
+import os
+
+wsgi_app = "panaderia.wsgi:application"
+worker_class = "sync"
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+
+def post_worker_init(worker):
+    # Las conexiones de Django son por hilo: con varios hilos por worker la del hilo
+    # principal no atendería requests y quedaría abierta sin uso.
+    if worker.cfg.threads > 1:
+        return
+    from django.conf import settings
+
+    if settings.WARMUP_ON_STARTUP:
+        from apps.core.warmup import warm_database
+
+        warm_database()
@@ -44,6 +44,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.common.middleware.IPFilterMiddleware',
+    'apps.common.middleware.ProfilingMiddleware',
+    'apps.common.middleware.CircuitBreakerMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -52,6 +55,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'apps.common.middleware.SlowQueryLogMiddleware',
 ]
 
 ROOT_URLCONF = 'panaderia.urls'
@@ -79,12 +83,21 @@ WSGI_APPLICATION = 'panaderia.wsgi.application'
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        # Backend MySQL con circuit breaker en la conexión (apps.common.circuit).
+        'ENGINE': 'apps.common.backends.mysql',
         'NAME': 'panaderia',
         'USER': 'dev',
         'PASSWORD': 'devpass',
         'HOST': '192.168.100.50',
         'PORT': '3306',
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+            'read_timeout': int(os.getenv('DB_READ_TIMEOUT', '30')),
+            'write_timeout': int(os.getenv('DB_WRITE_TIMEOUT', '30')),
+        },
+        # Conexiones persistentes: la abierta en el warm-up sirve al primer request.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -147,7 +160,7 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
+        "apps.common.throttling.ClientIPAnonRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10/min",
@@ -155,5 +168,55 @@ REST_FRAMEWORK = {
 }
 
 FRONTEND_RESET_URL = os.getenv("FRONTEND_RESET_URL")
-EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_BACKEND = "apps.common.mail.CircuitBreakerEmailBackend"
+CIRCUIT_BREAKER_EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "10"))
+
+# Circuit breakers de SMTP y base de datos; estado en /api/metrics/ y `manage.py check_db`.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+CIRCUIT_BREAKER_RESET_TIMEOUT = float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30"))
+# Alias de CACHES donde cada proceso publica las transiciones de sus breakers; para que
+# `check_db` vea el estado de los workers debe ser una caché compartida (Redis, Memcached, DB).
+CIRCUIT_BREAKER_CACHE = os.getenv("CIRCUIT_BREAKER_CACHE", "default")
+# /api/metrics/ solo responde a usuarios staff o a estas redes internas.
+METRICS_ALLOWED_NETWORKS = [
+    cidr.strip() for cidr in os.getenv("METRICS_ALLOWED_NETWORKS", "127.0.0.0/8,::1/128").split(",") if cidr.strip()
+]
 
+# Log de consultas lentas (apps.common.querylog); ver `manage.py slow_queries`.
+# Opt-in: cada consulta lenta se emite por el logger "apps.common.querylog" (la rotación la
+# configura el despliegue en LOGGING); SLOW_QUERY_LOG_FILE agrega el JSONL que lee el comando.
+# El EXPLAIN corre en el hilo del request, así que su muestreo también arranca apagado.
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "0") == "1"
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0"))
+SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE")
+
+# Profiler por muestreo (apps.common.profiling); exportar con `manage.py export_profiles`.
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "0") == "1"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0.01"))
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_MAX_ENDPOINTS = 50
+PROFILING_MAX_STACKS = 2000
+PROFILING_DUMP_DIR = os.getenv("PROFILING_DUMP_DIR", str(BASE_DIR / "profiles"))
+# El volcado lo hace un hilo aparte: cada N requests perfilados o cada tantos segundos.
+PROFILING_DUMP_EVERY = int(os.getenv("PROFILING_DUMP_EVERY", "20"))
+PROFILING_DUMP_INTERVAL_S = float(os.getenv("PROFILING_DUMP_INTERVAL_S", "30"))
+
+# Endpoint /api/v1/batch/
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "10"))
+BATCH_MAX_BODY_BYTES = int(os.getenv("BATCH_MAX_BODY_BYTES", str(256 * 1024)))
+
+# Warm-up de workers (apps.core.warmup), ejecutado al cargar panaderia.wsgi; ver `manage.py bench_startup`.
+# La conexión a la base se abre en cada worker después del fork (post_worker_init en gunicorn.conf.py).
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "1") == "1"
+WARMUP_DATABASE = os.getenv("WARMUP_DATABASE", "1") == "1"
+
+# IP del cliente y filtrado por red (apps.common.request / IPFilterMiddleware).
+# X-Forwarded-For solo se tiene en cuenta si REMOTE_ADDR pertenece a TRUSTED_PROXIES.
+TRUSTED_PROXIES = [cidr.strip() for cidr in os.getenv("TRUSTED_PROXIES", "").split(",") if cidr.strip()]
+IP_ALLOWLIST = [cidr.strip() for cidr in os.getenv("IP_ALLOWLIST", "").split(",") if cidr.strip()]
+IP_DENYLIST = [cidr.strip() for cidr in os.getenv("IP_DENYLIST", "").split(",") if cidr.strip()]
+IP_DENYLIST_FILE = os.getenv("IP_DENYLIST_FILE")
+IP_FILTER_DEFAULT = os.getenv("IP_FILTER_DEFAULT", "allow")
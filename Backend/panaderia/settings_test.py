@@ -1,10 +1,12 @@
 from .settings import *  # noqa
 
 DATABASES["default"] = {
-    "ENGINE": "django.db.backends.sqlite3",
+    "ENGINE": "apps.common.backends.sqlite3",
     "NAME": BASE_DIR / "test.sqlite3",
 }
 
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
+
+SLOW_QUERY_LOG_FILE = None
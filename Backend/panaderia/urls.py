@@ -9,6 +9,6 @@ urlpatterns = [
 
     # Prefijo único v1: cada app define sus subrutas SIN "api/v1/" adentro
     path("api/v1/", include(("apps.accounts.urls", "accounts"), namespace="v1-accounts")),
-    path("api/v1/", include(("apps.core.urls", "core"), namespace="v1-core")),
+    path("api/v1/", include("apps.core.urls_v1", namespace="v1-core")),
 ]
 
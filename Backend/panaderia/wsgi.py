@@ -9,8 +9,19 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
+from django.db import connections
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'panaderia.settings')
 
 application = get_wsgi_application()
+
+# Prepara URLs, hashers, JWT y serializers antes del primer request real. Con
+# `gunicorn --preload` esto corre en el master: no se deja ninguna conexión abierta para
+# que los workers no hereden el socket. La conexión la abre cada worker (gunicorn.conf.py).
+if settings.WARMUP_ON_STARTUP:
+    from apps.core.warmup import warm_up
+
+    warm_up()
+    connections.close_all()